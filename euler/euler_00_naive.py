@@ -9,6 +9,94 @@ import math
 
 
 DEBUG = False
+LIMB_DIGITS = 4
+LIMB = 10 ** LIMB_DIGITS
+LIMB_LEAF_LEVEL = 4
+LIMB_SPLIT_MIN = 10 ** 64
+LIMB_DIGITS_SUM = [0]
+LIMB_F = [0]
+for _ in range(LIMB_DIGITS):
+    LIMB_DIGITS_SUM = [s + d for d in range(10) for s in LIMB_DIGITS_SUM]
+    LIMB_F = [s + math.factorial(d) for d in range(10) for s in LIMB_F]
+# LIMB_F counts leading zeros of limb as 0! = 1, highest limb of n has no leading zeros
+LIMB_TOP_F = [LIMB_F[limb] - LIMB_DIGITS + len(str(limb)) for limb in range(LIMB)]
+
+
+def int_limbs(n):
+    """
+    Split number n into base 10**4 limbs, least significant first.
+    Big n is split by divide and conquer: n = high * 10**(4 * 2**j) + low and both halves are split recursively,
+    n and halves below 10**64 are split limb by limb. So n is not divided by 10 digit by digit and str(n)
+    is not used (Python int to str conversion is limited to 4300 digits).
+    For n = 1234567 limbs are 4567, 123
+    :param n: number >= 0
+    :return: list of limbs, last limb is not 0 except for n = 0
+    """
+    limbs = []
+    if n < LIMB_SPLIT_MIN:
+        while True:
+            n, limb = divmod(n, LIMB)
+            limbs.append(limb)
+            if not n:
+                return limbs
+    powers = [LIMB]
+    while powers[-1] * powers[-1] <= n:
+        powers.append(powers[-1] * powers[-1])
+
+    def split(x, level):
+        if level < LIMB_LEAF_LEVEL:
+            for _ in range(2 << level):
+                x, limb = divmod(x, LIMB)
+                limbs.append(limb)
+        elif not x:
+            limbs.extend([0] * (2 << level))
+        else:
+            high, low = divmod(x, powers[level])
+            split(low, level - 1)
+            split(high, level - 1)
+
+    split(n, len(powers) - 1)
+    while len(limbs) > 1 and not limbs[-1]:
+        limbs.pop()
+    return limbs
+
+
+def digits_count(n):
+    """
+    Returns number of digits of number n >= 0 without str(n).
+    Count is estimated from n bit length and corrected by one comparison with power of 10.
+    :param n: n
+    :return: number of digits
+    """
+    if n < 10:
+        return 1
+    count = int((n.bit_length() - 1) * 0.30102999566398120) + 1
+    if n >= 10 ** count:
+        count += 1
+    elif n < 10 ** (count - 1):
+        count -= 1
+    return count
+
+
+def first_digits(n, k):
+    """
+    Returns first k digits of number n >= 0, for example first_digits(34256, 2) = 34
+    :param n: n
+    :param k: number of digits
+    :return: number made of first k digits (n if it has at most k digits)
+    """
+    count = digits_count(n)
+    return n // 10 ** (count - k) if count > k else n
+
+
+def last_digits(n, k):
+    """
+    Returns last k digits of number n >= 0, for example last_digits(34256, 2) = 56
+    :param n: n
+    :param k: number of digits
+    :return: number made of last k digits
+    """
+    return n % 10 ** k
 
 
 def digits_sum(n):
@@ -19,6 +107,8 @@ def digits_sum(n):
     :param n: n
     :return: sum of digits
     """
+    if isinstance(n, int):
+        return sum(LIMB_DIGITS_SUM[limb] for limb in int_limbs(n))
     return sum(int(ch) for ch in str(n))
 
 
@@ -30,6 +120,9 @@ def f(n):
     :param n: number
     :return: sum digit factorial
     """
+    if isinstance(n, int):
+        *limbs, top = int_limbs(n)
+        return sum(LIMB_F[limb] for limb in limbs) + LIMB_TOP_F[top]
     return sum(math.factorial(int(ch)) for ch in str(n))
 
 
@@ -12,6 +12,15 @@ from itertools import combinations
 
 DEBUG = False
 FACTORIALS = [math.factorial(i) for i in range(10)]
+LIMB_DIGITS = 4
+LIMB = 10 ** LIMB_DIGITS
+LIMB_DIGITS_SUM = [0]
+LIMB_F = [0]
+for _ in range(LIMB_DIGITS):
+    LIMB_DIGITS_SUM = [s + d for d in range(10) for s in LIMB_DIGITS_SUM]
+    LIMB_F = [s + FACTORIALS[d] for d in range(10) for s in LIMB_F]
+# LIMB_F counts leading zeros of limb as 0! = 1, highest limb of n has no leading zeros
+LIMB_TOP_F = [LIMB_F[limb] - LIMB_DIGITS + len(str(limb)) for limb in range(LIMB)]
 
 
 def digits_gen(n):
@@ -35,6 +44,15 @@ def digits_sum(n):
     :param n: n
     :return: sum of digits
     """
+    if isinstance(n, int):
+        # Sum 4 digits limbs by LIMB_DIGITS_SUM table
+        sum_ = 0
+        while n:
+            n, limb = divmod(n, LIMB)
+            sum_ += LIMB_DIGITS_SUM[limb]
+        return sum_
+    if isinstance(n, DigitCounts):
+        return n.digits_sum()
     return sum(int(ch) for ch in str(n))
 
 
@@ -106,6 +124,69 @@ class Digits:
                 return
 
 
+class DigitCounts:
+    """
+    Class implements candidate for g(i) as digits multiset: counts[d] is number of digits d.
+    Number value has digits in non-decreasing order, eg. counts of 3, 4, 2 is number 234.
+    next() steps to the next candidate by length and value and updates f_value with the changed counts only,
+    so each step costs O(1) instead of O(len(number)).
+    """
+    def __init__(self, number):
+        self.counts = [0] * 10
+        for ch in str(number):
+            self.counts[int(ch)] += 1
+        self.f_value = sum(c * FACTORIALS[d] for d, c in enumerate(self.counts))
+
+    def __str__(self):
+        """ Return number value as str. """
+        return ''.join(str(d) * c for d, c in enumerate(self.counts))
+
+    def __int__(self):
+        """ Return number value as int. """
+        return int(str(self))
+
+    def __len__(self):
+        return sum(self.counts)
+
+    def digits_sum(self):
+        return sum(c * d for d, c in enumerate(self.counts))
+
+    def fill(self, d, size):
+        """
+        Add size the smallest digits starting from d according PREFIX definition 122333444455555...
+        Digit d < 9 may occur at most d times, digit 9 is not limited. Counts of digits from d must be 0.
+        """
+        counts = self.counts
+        while d < 9 and size:
+            counts[d] = min(d, size)
+            self.f_value += counts[d] * FACTORIALS[d]
+            size -= counts[d]
+            d += 1
+        counts[9] += size
+        self.f_value += size * FACTORIALS[9]
+
+    def next(self):
+        """
+        Step to the next number with non-decreasing digits fulfilling PREFIX definition.
+        The highest non 9 digit d is increased, it and all 9s after it are filled again from d + 1,
+        eg. 1229 -> 1233. If all digits are 9, the next number is one digit longer and filled from 1, eg. 99 -> 122.
+        """
+        counts = self.counts
+        nines = counts[9]
+        d = 8
+        while d >= 0 and not counts[d]:
+            d -= 1
+        counts[9] = 0
+        self.f_value -= nines * FACTORIALS[9]
+        if d < 0:
+            self.fill(1, nines + 1)
+        else:
+            counts[d] -= 1
+            self.f_value -= FACTORIALS[d]
+            self.fill(d + 1, nines + 1)
+        return self
+
+
 def f(n):
     """
     Define f(n) as the sum of the factorials of the digits of n.
@@ -114,10 +195,18 @@ def f(n):
     :param n: number
     :return: sum digits factorial of n
     """
+    if isinstance(n, DigitCounts):
+        return n.f_value
     if isinstance(n, Digits):
         return sum(FACTORIALS[d] for d in n.num)
     else:
-        return sum(FACTORIALS[d] for d in digits_gen(int(n)))
+        # Sum 4 digits limbs by LIMB_F table, the highest limb by LIMB_TOP_F
+        n = int(n)
+        f_ = 0
+        while n >= LIMB:
+            n, limb = divmod(n, LIMB)
+            f_ += LIMB_F[limb]
+        return f_ + LIMB_TOP_F[n]
 
 
 sf_cache = {}
@@ -134,7 +223,8 @@ def sf(n):
     :return: sum digits of f(n)
     """
     sf_ = digits_sum(f(n))
-    sf_cache.setdefault(sf_, str(n))
+    if sf_ not in sf_cache:
+        sf_cache[sf_] = str(n)
     return sf_
 
 
@@ -160,7 +250,7 @@ def g_sequence(max_i):
     :param max_i: range for compute g(i) from 1 to max_i
     :return: None
     """
-    n = Digits(1)
+    n = DigitCounts(1)
     for i in range(1, max_i + 1):
         if not sf_cache.get(i):
             start_time = time.perf_counter()
@@ -168,12 +258,12 @@ def g_sequence(max_i):
                 n.next()
             stop_time = time.perf_counter()
             if DEBUG:
-                n9 = sum([1 for d in n.num if d == 9])
+                n9 = n.counts[9]
                 diff = f(n) - f(int('0' + '9' * n9))
                 print(
                     f"f(n) = {f(n):10}, "
                     f"sf(n) = {i:2}. sg({i:2}) = {digits_sum(n):4}. "
-                    f"Time: {stop_time - start_time:8.4f} seconds for len(n) = {len(str(n)):2}, n = {str(n):10} "
+                    f"Time: {stop_time - start_time:8.4f} seconds for len(n) = {len(n):2}, n = {str(n):10} "
                 )
         else:
             if DEBUG:
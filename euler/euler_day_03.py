@@ -7,6 +7,7 @@ Speed improvement in f(n) guessing - Day 3
 import cProfile, pstats, io
 import math
 import time
+from bisect import bisect_right
 from collections import defaultdict, namedtuple
 from functools import reduce
 from itertools import combinations
@@ -15,35 +16,162 @@ DEBUG = False
 g_cache = {}
 sg_cache = {}
 PREFIX = {}
+LIMB_DIGITS = 4
+LIMB = 10 ** LIMB_DIGITS
+LIMB_LEAF_LEVEL = 4
+LIMB_SPLIT_MIN = 10 ** 64
+LIMB_DIGITS_SUM = [0]
+for _ in range(LIMB_DIGITS):
+    LIMB_DIGITS_SUM = [s + d for d in range(10) for s in LIMB_DIGITS_SUM]
 
 
 def init_prefixes():
-    for i1 in range(2):
-        for i2 in range(3):
-            for i3 in range(4):
-                for i4 in range(5):
-                    for i5 in range(6):
-                        for i6 in range(7):
-                            for i7 in range(8):
-                                for i8 in range(9):
-                                    i = i1 + i2 + i3 + i4 + i5 + i6 + i7 + i8
-                                    if i:
-                                        prefix = ('1' * i1 + '2' * i2 + '3' * i3 + '4' * i4 +
-                                                  '5' * i5 + '6' * i6 + '7' * i7 + '8' * i8)
-                                        f_ = f(prefix)
-                                        PREFIX[f_] = prefix
-    PREFIX[0] = ''
+    """ Fill PREFIX with the smallest prefix for every f_prefix value from 0 to 9! - 1. """
+    PREFIX.update(enumerate(make_prefix_table()))
+
+
+def minimal_prefix(f_prefix):
+    """
+    Return the smallest prefix (digits 1-8 in ascending order) such that f(prefix) = f_prefix.
+    Digit d occurs max d times in prefix, so digits counts are simply digits of f_prefix
+    written in factorial number system: f_prefix = c1 * 1! + c2 * 2! + ... + c8 * 8!, 0 <= cd <= d.
+    Each other digits multiset with the same f is longer as d + 1 digits d can be replaced by one digit d + 1.
+    :param f_prefix: value from 0 to 9! - 1
+    :return: prefix as str
+    """
+    counts = [0] * 9
+    for d in range(8, 0, -1):
+        counts[d], f_prefix = divmod(f_prefix, FACTORIALS[d])
+    return ''.join(str(d) * counts[d] for d in range(1, 9))
+
+
+def make_prefix_table():
+    """
+    Build list of the smallest prefixes for all f_prefix values from 0 to 9! - 1.
+    List is built digit by digit: for digit d the table for digits 1..d-1 (indexes below d!)
+    is repeated for every count of digit d from 0 to d.
+    :return: list where list[f_prefix] = minimal_prefix(f_prefix)
+    """
+    prefixes = ['']
+    for d in range(1, 9):
+        prefixes = [prefix + str(d) * count for count in range(d + 1) for prefix in prefixes]
+    return prefixes
+
+
+def verify_prefix_table(prefixes):
+    """
+    Verify prefix table with dynamic programming over f_prefix values (shortest path over f values).
+    The smallest number for f_prefix is the smallest one from numbers for f_prefix - d! with inserted digit d.
+    Numbers are ordered by (length, lexicographic).
+    :param prefixes: table to verify - prefixes[f_prefix] is a prefix for f_prefix
+    :return: list of f_prefix values for which prefix in the table is wrong
+    """
+    best = ['']
+    for f_prefix in range(1, FACTORIALS[9]):
+        candidates = []
+        for d in range(1, 9):
+            if FACTORIALS[d] > f_prefix:
+                break
+            prefix = best[f_prefix - FACTORIALS[d]]
+            pos = bisect_right(prefix, str(d))
+            candidates.append(prefix[:pos] + str(d) + prefix[pos:])
+        best.append(min(candidates, key=lambda p: (len(p), p)))
+    return [f_prefix for f_prefix, prefix in enumerate(best) if prefixes[f_prefix] != prefix]
 
 
 FACTORIALS = [math.factorial(i) for i in range(10)]
 
 
+def int_limbs(n):
+    """
+    Split number n into base 10**4 limbs, least significant first.
+    Big n is split by divide and conquer: n = high * 10**(4 * 2**j) + low and both halves are split recursively,
+    n and halves below 10**64 are split limb by limb. So n is not divided by 10 digit by digit and str(n)
+    is not used (Python int to str conversion is limited to 4300 digits).
+    For n = 1234567 limbs are 4567, 123
+    :param n: number >= 0
+    :return: list of limbs, last limb is not 0 except for n = 0
+    """
+    limbs = []
+    if n < LIMB_SPLIT_MIN:
+        while True:
+            n, limb = divmod(n, LIMB)
+            limbs.append(limb)
+            if not n:
+                return limbs
+    powers = [LIMB]
+    while powers[-1] * powers[-1] <= n:
+        powers.append(powers[-1] * powers[-1])
+
+    def split(x, level):
+        if level < LIMB_LEAF_LEVEL:
+            for _ in range(2 << level):
+                x, limb = divmod(x, LIMB)
+                limbs.append(limb)
+        elif not x:
+            limbs.extend([0] * (2 << level))
+        else:
+            high, low = divmod(x, powers[level])
+            split(low, level - 1)
+            split(high, level - 1)
+
+    split(n, len(powers) - 1)
+    while len(limbs) > 1 and not limbs[-1]:
+        limbs.pop()
+    return limbs
+
+
+def digits_count(n):
+    """
+    Returns number of digits of number n >= 0 without str(n).
+    Count is estimated from n bit length and corrected by one comparison with power of 10.
+    :param n: n
+    :return: number of digits
+    """
+    if n < 10:
+        return 1
+    count = int((n.bit_length() - 1) * 0.30102999566398120) + 1
+    if n >= 10 ** count:
+        count += 1
+    elif n < 10 ** (count - 1):
+        count -= 1
+    return count
+
+
+def first_digits(n, k):
+    """
+    Returns first k digits of number n >= 0, for example first_digits(34256, 2) = 34
+    :param n: n
+    :param k: number of digits
+    :return: number made of first k digits (n if it has at most k digits)
+    """
+    count = digits_count(n)
+    return n // 10 ** (count - k) if count > k else n
+
+
+def last_digits(n, k):
+    """
+    Returns last k digits of number n >= 0, for example last_digits(34256, 2) = 56
+    :param n: n
+    :param k: number of digits
+    :return: number made of last k digits
+    """
+    return n % 10 ** k
+
+
 def digits_gen(n):
     """
     Yields number n digits in reverse sequence. For n = 342 sequence is 2, 4, 3
+    Digits of big n are taken from int_limbs(n), so big n is not divided by 10 digit by digit.
     :param n:
     :return:
     """
+    if n >= LIMB_SPLIT_MIN:
+        *limbs, n = int_limbs(n)
+        for limb in limbs:
+            for _ in range(LIMB_DIGITS):
+                limb, d = divmod(limb, 10)
+                yield d
     while True:
         yield n % 10
         n //= 10
@@ -59,7 +187,9 @@ def digits_sum(n):
     :param n: n
     :return: sum of digits
     """
-    return sum(int(ch) for ch in str(n))
+    if isinstance(n, int):
+        return sum(LIMB_DIGITS_SUM[limb] for limb in int_limbs(n))
+    return sum(int(ch) for ch in n)
 
 
 N_Number = namedtuple("N_Number", "prefix suffix_len")
@@ -9,31 +9,143 @@ import cProfile, pstats, io
 import contextlib
 import math
 import time
-from collections import defaultdict, namedtuple
+from collections import namedtuple
 from functools import reduce
 from itertools import combinations
 
 DEBUG = False
 g_cache = {}
 sg_cache = {}
-PREFIX = {}
 PREFIX_USED = {}
+LIMB_DIGITS = 4
+LIMB = 10 ** LIMB_DIGITS
+LIMB_LEAF_LEVEL = 4
+LIMB_SPLIT_MIN = 10 ** 64
+LIMB_DIGITS_SUM = [0]
+for _ in range(LIMB_DIGITS):
+    LIMB_DIGITS_SUM = [s + d for d in range(10) for s in LIMB_DIGITS_SUM]
 
-PREFIX = {221439: '1233455566666677788888', 71679: '1233455567777778', 95359: '13444556666667788', 308479: '13444556777778888888', 332159: '12233344445666666788888888', 182399: '12233344445677778888', 206079: '12334566666688888', 56319: '12334567778', 79999: '1344466666677777778', 293119: '134446778888888', 316799: '122333444455555666667777778888888', 167039: '12233344445555578888', 190719: '123345555566666777778888', 144639: '123345555566667777888', 18559: '1344455556666777', 335359: '1344455556667788888888', 209279: '1223334444555666788888', 163199: '1223334444555668888', 37119: '12334555667777777', 353919: '12334555677777788888888', 227839: '134445567777788888', 181759: '134445577778888', 55679: '122333444457778', 9599: '122333444456666667', 246399: '123345666666888888', 200319: '1233456666677777778888', 74239: '13444666667777778', 28159: '13444666677777', 264959: '1223334444555556667777888888', 218879: '1223334444555556677788888', 92799: '1233455555667788', 357759: '123345555566666677777788888888', 185599: '1344455556666677778888', 87679: '13444555566788', 278399: '122333444455567777777888888', 180479: '1223334444555666667778888', 8319: '1233455566667', 273279: '123345556777777888888', 101119: '1344455777788', 3199: '13444556666', 193919: '122333444456667777778888', 95999: '1223334444577788', 286719: '1233456666668888888', 188799: '123345666777778888', 16639: '1344466777', 281599: '134446666667777777888888', 109439: '12233344445555566667777788', 11519: '122333444455555677', 202239: '123345555588888', 311679: '123345555566666777778888888', 41599: '13444555568', 151039: '13444555566666677777888', 243839: '122333444455566888888', 353279: '122333444455577777788888888', 83199: '1233455566688', 192639: '1233455567777778888', 285439: '134445566668888888', 31999: '134445566777777', 124799: '1223334444566666888', 234239: '1223334444566677777788888', 327039: '12334566666688888888', 73599: '12334566667777778', 166399: '1344478888', 275839: '1344466666777777888888', 5759: '1223334444555557', 115199: '1223334444555556666677777788', 207999: '12334555556788888', 213759: '1233455555667788888', 53119: '134445555666778', 58879: '13444555566667778', 261119: '122333444455566666777888888', 266879: '12233344445556666667777888888', 106239: '123345557777788', 111999: '12334555677777788', 314239: '1344455667777778888888', 319999: '134445566677777778888888', 159359: '1223334444566667777777888', 165119: '12233344445666668888', 4479: '123345666666', 10239: '12334577', 212479: '1344467788888', 218239: '134446677788888', 57599: '122333444455555667778', 63359: '12233344445555566677778', 265599: '123345555566667777888888', 323199: '123345555588888888', 168319: '1344455556678888', 225919: '13444555566666777788888', 71039: '12233344445557777778', 128639: '12233344445556667888', 336639: '12334555666667788888888', 31359: '123345556777777', 239359: '1344455666777777788888', 296959: '1344455666666778888888', 142079: '1223334444567777888', 199679: '12233344445666677777778888', 44799: '1233456666668', 102399: '12334566777788', 310399: '134446666777778888888', 5119: '134447', 213119: '12233344445555567788888', 270719: '122333444455555666677777888888', 115839: '123345555566666677777788', 328959: '12334555556788888888', 231679: '1344455556666667777788888', 81919: '134445555688', 347519: '1223334444555666666777788888888', 197759: '1223334444555677777778888', 100479: '1233455566666677788', 313599: '1233455567777778888888', 216319: '13444556666667788888', 66559: '13444556777778', 85119: '12334566666688', 298239: '12334567778888888', 200959: '1344466666677777778888', 51199: '134446778', 69759: '123345555566666777778', 23679: '123345555566667777', 139519: '1344455556666777888', 93439: '1344455556667788', 279039: '12334555667777777888888', 232959: '12334555677777788888', 348799: '134445567777788888888', 302719: '134445577778888888', 125439: '123345666666888', 79359: '1233456666677777778', 195199: '13444666667777778888', 149119: '13444666677777888', 334719: '1233455555667788888888', 236799: '123345555566666677777788888', 306559: '1344455556666677778888888', 208639: '13444555566788888', 250239: '1233455566667888888', 152319: '123345556777777888', 222079: '1344455777788888', 124159: '13444556666888', 165759: '1233456666668888', 67839: '123345666777778', 137599: '1344466777888', 39679: '134446666667777777', 81279: '123345555588', 162559: '13444555568888', 271999: '13444555566666677777888888', 325119: '1233455566688888888', 43519: '134445566668', 152959: '134445566777777888', 315519: '12334566667777778888888', 287359: '1344478888888', 33919: '1344466666777777', 87039: '12334555556788', 174079: '134445555666778888', 179839: '13444555566667778888', 348159: '123345557777788888888', 72319: '1344455667777778', 78079: '134445566677777778', 252159: '12334577888888', 333439: '1344467788888888', 339199: '134446677788888888', 289279: '1344455556678888888', 346879: '13444555566666777788888888', 215679: '12334555666667788888', 360319: '1344455666777777788888888', 55039: '1344455666666778', 344319: '12334566777788888888', 68479: '134446666777778', 126079: '134447888', 352639: '1344455556666667777788888888', 202879: '134445555688888', 342399: '1233455566666677788888888', 337279: '13444556666667788888888', 187519: '13444556777778888', 177279: '12334567778888', 321919: '1344466666677777778888888', 172159: '134446778888', 260479: '1344455556666777888888', 214399: '1344455556667788888', 158079: '12334555667777777888', 106879: '134445567777788', 60799: '134445577778', 321279: '1233456666677777778888888', 316159: '13444666667777778888888', 270079: '13444666677777888888', 64639: '1344455556666677778', 329599: '13444555566788888888', 129279: '1233455566667888', 343039: '1344455777788888888', 245119: '13444556666888888', 309759: '123345666777778888888', 258559: '1344466777888888', 160639: '134446666667777777888', 283519: '13444555568888888', 30079: '13444555566666677777', 204159: '1233455566688888', 164479: '134445566668888', 273919: '134445566777777888888', 194559: '12334566667777778888', 45439: '1344478', 154879: '1344466666777777888', 295039: '134445555666778888888', 300799: '13444555566667778888888', 227199: '123345557777788888', 193279: '1344455667777778888', 199039: '134445566677777778888', 131199: '12334577888', 91519: '1344467788', 97279: '134446677788', 47359: '1344455556678', 104959: '13444555566666777788', 94719: '12334555666667788', 118399: '1344455666777777788', 175999: '1344455666666778888', 223359: '12334566777788888', 189439: '134446666777778888', 247039: '134447888888', 110719: '1344455556666667777788', 323839: '134445555688888888'}
+
+class PrefixTable(dict):
+    """ Dictionary f_prefix -> the smallest prefix. Missing prefixes are solved on demand. """
+    def __missing__(self, f_prefix):
+        prefix = self[f_prefix] = minimal_prefix(f_prefix)
+        return prefix
+
+
+def minimal_prefix(f_prefix):
+    """
+    Return the smallest prefix (digits 1-8 in ascending order) such that f(prefix) = f_prefix.
+    Digits counts are digits of f_prefix written in factorial number system,
+    see euler_day_03.minimal_prefix for details.
+    """
+    counts = [0] * 9
+    for d in range(8, 0, -1):
+        counts[d], f_prefix = divmod(f_prefix, FACTORIALS[d])
+    return ''.join(str(d) * counts[d] for d in range(1, 9))
+
+
+PREFIX = PrefixTable()
 
 
 def init_prefixes():
     assert_sg(True)
 
 FACTORIALS = [math.factorial(i) for i in range(10)]
+DIGIT_CHARS = '0123456789'
+DIGIT_BYTES = b'0123456789'
+
+
+def int_limbs(n):
+    """
+    Split number n into base 10**4 limbs, least significant first.
+    Big n is split by divide and conquer: n = high * 10**(4 * 2**j) + low and both halves are split recursively,
+    n and halves below 10**64 are split limb by limb. So n is not divided by 10 digit by digit and str(n)
+    is not used (Python int to str conversion is limited to 4300 digits).
+    For n = 1234567 limbs are 4567, 123
+    :param n: number >= 0
+    :return: list of limbs, last limb is not 0 except for n = 0
+    """
+    limbs = []
+    if n < LIMB_SPLIT_MIN:
+        while True:
+            n, limb = divmod(n, LIMB)
+            limbs.append(limb)
+            if not n:
+                return limbs
+    powers = [LIMB]
+    while powers[-1] * powers[-1] <= n:
+        powers.append(powers[-1] * powers[-1])
+
+    def split(x, level):
+        if level < LIMB_LEAF_LEVEL:
+            for _ in range(2 << level):
+                x, limb = divmod(x, LIMB)
+                limbs.append(limb)
+        elif not x:
+            limbs.extend([0] * (2 << level))
+        else:
+            high, low = divmod(x, powers[level])
+            split(low, level - 1)
+            split(high, level - 1)
+
+    split(n, len(powers) - 1)
+    while len(limbs) > 1 and not limbs[-1]:
+        limbs.pop()
+    return limbs
+
+
+def digits_count(n):
+    """
+    Returns number of digits of number n >= 0 without str(n).
+    Count is estimated from n bit length and corrected by one comparison with power of 10.
+    :param n: n
+    :return: number of digits
+    """
+    if n < 10:
+        return 1
+    count = int((n.bit_length() - 1) * 0.30102999566398120) + 1
+    if n >= 10 ** count:
+        count += 1
+    elif n < 10 ** (count - 1):
+        count -= 1
+    return count
+
+
+def first_digits(n, k):
+    """
+    Returns first k digits of number n >= 0, for example first_digits(34256, 2) = 34
+    :param n: n
+    :param k: number of digits
+    :return: number made of first k digits (n if it has at most k digits)
+    """
+    count = digits_count(n)
+    return n // 10 ** (count - k) if count > k else n
+
+
+def last_digits(n, k):
+    """
+    Returns last k digits of number n >= 0, for example last_digits(34256, 2) = 56
+    :param n: n
+    :param k: number of digits
+    :return: number made of last k digits
+    """
+    return n % 10 ** k
 
 
 def digits_gen(n):
     """
     Yields number n digits in reverse sequence. For n = 342 sequence is 2, 4, 3
+    Digits of big n are taken from int_limbs(n), so big n is not divided by 10 digit by digit.
     :param n:
     :return:
     """
+    if n >= LIMB_SPLIT_MIN:
+        *limbs, n = int_limbs(n)
+        for limb in limbs:
+            for _ in range(LIMB_DIGITS):
+                limb, d = divmod(limb, 10)
+                yield d
     while True:
         yield n % 10
         n //= 10
@@ -41,11 +153,34 @@ def digits_gen(n):
             break
 
 
+def digit_counts(n):
+    """
+    Return counts of digits 0..9 in digit string n (str or bytes).
+    Every digit is counted by str.count / bytes.count at C speed, no int(n) conversion.
+    :param n: digit string
+    :return: list of 10 counts
+    :raise ValueError: n has not digit characters
+    """
+    counts = [n.count(d) for d in (DIGIT_CHARS if isinstance(n, str) else DIGIT_BYTES)]
+    if sum(counts) != len(n):
+        raise ValueError(f'{n[:20]!r} is not digit string')
+    return counts
+
+
+def f_and_digits_sum(n):
+    """
+    Return f(n) and digits sum of digit string n (str or bytes) computed from digit_counts(n).
+    For example f_and_digits_sum('342') = (32, 9)
+    """
+    counts = digit_counts(n)
+    return sum(c * FACTORIALS[d] for d, c in enumerate(counts)), sum(c * d for d, c in enumerate(counts))
+
+
 def digits_sum(n):
     if isinstance(n, int):
-        return sum([d for d in digits_gen(n)])
-    elif isinstance(n, str):
-        return sum([int(ch) for ch in n])
+        return sum(LIMB_DIGITS_SUM[limb] for limb in int_limbs(n))
+    elif isinstance(n, (str, bytes)):
+        return f_and_digits_sum(n)[1]
     else:
         return sum([d for d in n.digits_gen()])
 
@@ -69,6 +204,25 @@ def f_value_with_digit_sum(digits_sum):
         return str(d) + '9' * n9
 
 
+def f_value_divmod(digits_sum):
+    """
+    Return divmod(f_value, 9!) for f_value = int(f_value_with_digit_sum(digits_sum)) without building f_value.
+    f_value is digit d followed by k digits 9, so it is equal (d + 1) * 10**k - 1 for k, d = divmod(digits_sum, 9).
+    :param digits_sum: digits sum of f_value
+    :return: f_value // 9!, f_value % 9!
+    """
+    k, d = divmod(digits_sum, 9)
+    return divmod((d + 1) * 10 ** k - 1, FACTORIALS[9])
+
+
+def reverse_f_value_with_digit_sum(digits_sum):
+    """ Return number such that f(number) = int(f_value_with_digit_sum(digits_sum)). """
+    suffix_len, f_prefix = f_value_divmod(digits_sum)
+    prefix = PREFIX[f_prefix]
+    PREFIX_USED[f_prefix] = prefix
+    return N_Number(prefix, suffix_len)
+
+
 def f(n):
     """
     Define f(n) as the sum of the factorials of the digits of n.
@@ -77,8 +231,8 @@ def f(n):
     :param n: number
     :return: sum digits factorial of n
     """
-    if isinstance(n, str):
-        n = int(n)
+    if isinstance(n, (str, bytes)):
+        return f_and_digits_sum(n)[0]
     if isinstance(n, int):
         return sum([FACTORIALS[d] for d in digits_gen(n)])
     elif isinstance(n, list):
@@ -135,16 +289,15 @@ def g_sequence(max_i):
     for i in range(1, max_i + 1):
         if i < 65:
             continue
-        f_value = int(f_value_with_digit_sum(i))
-        best_n = reverse_f(f_value)
+        best_n = reverse_f_value_with_digit_sum(i)
         if DEBUG:
             l_str = str(len(str(best_n.prefix)) + best_n.suffix_len)
             if len(l_str) > 19:
                 l_str = '...'+l_str[-16:]
             prefix = best_n.prefix + '+'
             print(
-                f'len={best_n.suffix_len-last_len:21}, f(n) = {str(f_value)[:10]:10}, '
-                f'prefix_value: {f_value%FACTORIALS[9]}')
+                f'len={best_n.suffix_len-last_len:21}, f(n) = {f_value_with_digit_sum(i)[:10]:10}, '
+                f'prefix_value: {f_value_divmod(i)[1]}')
             '''
             print(
                 f'len={l_str:21}, f(n) = {f_value:40}, '
@@ -225,56 +378,69 @@ def dic_as_list(dic, *, seq=True):
     return lst
 
 
-def make_sgi_mod_table(base_value=181):
-    # init_prefixes()
-    di = defaultdict(list)
-    dv = defaultdict(set)
-    dist = set()
-    for i in range(base_value, 50001):
-        f_v = int(f_value_with_digit_sum(i))
-        n = reverse_f(f_v)
-        d = f_v % FACTORIALS[9]
-        dist.add(d)
-        if n.suffix_len * 9 > 1000000000000:
-            v = n.suffix_len * 9 % 1000000000000
-            dv[d].add(v)
-        di[d].append(i)
-    distances = sorted(list(dist))
-
-    dic = {}
-    for d in distances:
-        vl = list(dv[d])
-        v = ""
-        if len(vl) == 1:
-            v = str(vl[0])
-        else:
-            v = vl
-        dd = defaultdict(int)
-        for i in range(1, len(di[d])):
-            dd[di[d][i] - di[d][i - 1]] += 1
-        s = ""
-        if len(dd) == 1:
-            s = list(dd.keys())[0]
-        elif len(dd) == 2:
-            dic[di[d][1]] = (d, di[d][3] - di[d][1])
-            s = di[d][2] - di[d][0]
-        else:
-            s = dd
-        dic[di[d][0]] = (d, s)
-    min_pos = min(dic.keys())
-    max_pos = max(dic.keys())
-    for p in range(min_pos, max_pos):
-        d, step = dic[p]
-        if p + step < max_pos and not dic.get(p + step):
-            dic[p + step] = (d, step)
+def f_value_mod_step(state, modulus):
+    """
+    Move f_value mod modulus state from digits sum i to i + 1.
+    State is (d, 10**k mod modulus) for k, d = divmod(i, 9) and f_value = (d + 1) * 10**k - 1.
+    """
+    d, p = state
+    return (0, p * 10 % modulus) if d == 8 else (d + 1, p)
+
+
+def f_value_mod_cycle(modulus=FACTORIALS[9]):
+    """
+    Detect cycle of f_value mod modulus sequence with Brent algorithm.
+    For 9! sequence is periodic from i = 63 (10**7 is divisible by 2**7 * 5) with period 162.
+    :param modulus: modulo
+    :return: mu - the first i in cycle, lam - cycle length
+    """
+    start = (0, 1 % modulus)
+    power = lam = 1
+    tortoise, hare = start, f_value_mod_step(start, modulus)
+    while tortoise != hare:
+        if power == lam:
+            tortoise = hare
+            power *= 2
+            lam = 0
+        hare = f_value_mod_step(hare, modulus)
+        lam += 1
+    tortoise = hare = start
+    for _ in range(lam):
+        hare = f_value_mod_step(hare, modulus)
+    mu = 0
+    while tortoise != hare:
+        tortoise = f_value_mod_step(tortoise, modulus)
+        hare = f_value_mod_step(hare, modulus)
+        mu += 1
+    return mu, lam
+
+
+def f_value_mod_gen(start, modulus=FACTORIALS[9]):
+    """ Yield f_value mod modulus for digits sum start, start + 1, ... with one multiplication per 9 elements. """
+    k, d = divmod(start, 9)
+    state = d, pow(10, k, modulus)
+    while True:
+        d, p = state
+        yield ((d + 1) * p - 1) % modulus
+        state = f_value_mod_step(state, modulus)
+
 
+def make_sgi_mod_table(base_value=181):
+    """
+    Build sgi_mod_table streaming f_value mod 9! for one cycle found by f_value_mod_cycle.
+    :param base_value: the first i in table
+    :return: list of (i, f_value % 9!, PREFIX, PREFIX digits sum, carry)
+    """
+    f9 = FACTORIALS[9]
+    mu, lam = f_value_mod_cycle(f9)
+    base_value = max(base_value, mu + 1)
+    values = f_value_mod_gen(base_value - 1, f9)
+    prev = next(values)
     sgi_mod_table = []
-    for p, (d, s) in sorted(dic.items()):
-        carry_on = 0
-        prev = p-1 if p!=min_pos else max_pos
-        if d < dic[prev][0]:
-            carry_on = 1
-        sgi_mod_table.append((p, d, PREFIX[d], digits_sum(PREFIX[d]), carry_on))
+    for i, d in zip(range(base_value, base_value + lam), values):
+        carry_on = 1 if d < prev else 0
+        sgi_mod_table.append((i, d, PREFIX[d], digits_sum(PREFIX[d]), carry_on))
+        prev = d
     return sgi_mod_table
 
 
@@ -5,30 +5,523 @@ Final submission with constant time - based on formula for sum_sg.
 
 """
 
-import cProfile, pstats, io
-import contextlib
 import math
+import mmap
+import os
+import struct
+import sys
+import threading
 import time
-from collections import defaultdict, namedtuple
-from functools import reduce
-from itertools import combinations
+import zlib
+from array import array
+from collections import defaultdict
+from functools import lru_cache, total_ordering
+from itertools import accumulate, repeat
 
 DEBUG = False
 F9 = 362880
-sg_cache = {}
-PREFIX = {221439: '1233455566666677788888', 71679: '1233455567777778', 95359: '13444556666667788', 308479: '13444556777778888888', 332159: '12233344445666666788888888', 182399: '12233344445677778888', 206079: '12334566666688888', 56319: '12334567778', 79999: '1344466666677777778', 293119: '134446778888888', 316799: '122333444455555666667777778888888', 167039: '12233344445555578888', 190719: '123345555566666777778888', 144639: '123345555566667777888', 18559: '1344455556666777', 335359: '1344455556667788888888', 209279: '1223334444555666788888', 163199: '1223334444555668888', 37119: '12334555667777777', 353919: '12334555677777788888888', 227839: '134445567777788888', 181759: '134445577778888', 55679: '122333444457778', 9599: '122333444456666667', 246399: '123345666666888888', 200319: '1233456666677777778888', 74239: '13444666667777778', 28159: '13444666677777', 264959: '1223334444555556667777888888', 218879: '1223334444555556677788888', 92799: '1233455555667788', 357759: '123345555566666677777788888888', 185599: '1344455556666677778888', 87679: '13444555566788', 278399: '122333444455567777777888888', 180479: '1223334444555666667778888', 8319: '1233455566667', 273279: '123345556777777888888', 101119: '1344455777788', 3199: '13444556666', 193919: '122333444456667777778888', 95999: '1223334444577788', 286719: '1233456666668888888', 188799: '123345666777778888', 16639: '1344466777', 281599: '134446666667777777888888', 109439: '12233344445555566667777788', 11519: '122333444455555677', 202239: '123345555588888', 311679: '123345555566666777778888888', 41599: '13444555568', 151039: '13444555566666677777888', 243839: '122333444455566888888', 353279: '122333444455577777788888888', 83199: '1233455566688', 192639: '1233455567777778888', 285439: '134445566668888888', 31999: '134445566777777', 124799: '1223334444566666888', 234239: '1223334444566677777788888', 327039: '12334566666688888888', 73599: '12334566667777778', 166399: '1344478888', 275839: '1344466666777777888888', 5759: '1223334444555557', 115199: '1223334444555556666677777788', 207999: '12334555556788888', 213759: '1233455555667788888', 53119: '134445555666778', 58879: '13444555566667778', 261119: '122333444455566666777888888', 266879: '12233344445556666667777888888', 106239: '123345557777788', 111999: '12334555677777788', 314239: '1344455667777778888888', 319999: '134445566677777778888888', 159359: '1223334444566667777777888', 165119: '12233344445666668888', 4479: '123345666666', 10239: '12334577', 212479: '1344467788888', 218239: '134446677788888', 57599: '122333444455555667778', 63359: '12233344445555566677778', 265599: '123345555566667777888888', 323199: '123345555588888888', 168319: '1344455556678888', 225919: '13444555566666777788888', 71039: '12233344445557777778', 128639: '12233344445556667888', 336639: '12334555666667788888888', 31359: '123345556777777', 239359: '1344455666777777788888', 296959: '1344455666666778888888', 142079: '1223334444567777888', 199679: '12233344445666677777778888', 44799: '1233456666668', 102399: '12334566777788', 310399: '134446666777778888888', 5119: '134447', 213119: '12233344445555567788888', 270719: '122333444455555666677777888888', 115839: '123345555566666677777788', 328959: '12334555556788888888', 231679: '1344455556666667777788888', 81919: '134445555688', 347519: '1223334444555666666777788888888', 197759: '1223334444555677777778888', 100479: '1233455566666677788', 313599: '1233455567777778888888', 216319: '13444556666667788888', 66559: '13444556777778', 85119: '12334566666688', 298239: '12334567778888888', 200959: '1344466666677777778888', 51199: '134446778', 69759: '123345555566666777778', 23679: '123345555566667777', 139519: '1344455556666777888', 93439: '1344455556667788', 279039: '12334555667777777888888', 232959: '12334555677777788888', 348799: '134445567777788888888', 302719: '134445577778888888', 125439: '123345666666888', 79359: '1233456666677777778', 195199: '13444666667777778888', 149119: '13444666677777888', 334719: '1233455555667788888888', 236799: '123345555566666677777788888', 306559: '1344455556666677778888888', 208639: '13444555566788888', 250239: '1233455566667888888', 152319: '123345556777777888', 222079: '1344455777788888', 124159: '13444556666888', 165759: '1233456666668888', 67839: '123345666777778', 137599: '1344466777888', 39679: '134446666667777777', 81279: '123345555588', 162559: '13444555568888', 271999: '13444555566666677777888888', 325119: '1233455566688888888', 43519: '134445566668', 152959: '134445566777777888', 315519: '12334566667777778888888', 287359: '1344478888888', 33919: '1344466666777777', 87039: '12334555556788', 174079: '134445555666778888', 179839: '13444555566667778888', 348159: '123345557777788888888', 72319: '1344455667777778', 78079: '134445566677777778', 252159: '12334577888888', 333439: '1344467788888888', 339199: '134446677788888888', 289279: '1344455556678888888', 346879: '13444555566666777788888888', 215679: '12334555666667788888', 360319: '1344455666777777788888888', 55039: '1344455666666778', 344319: '12334566777788888888', 68479: '134446666777778', 126079: '134447888', 352639: '1344455556666667777788888888', 202879: '134445555688888', 342399: '1233455566666677788888888', 337279: '13444556666667788888888', 187519: '13444556777778888', 177279: '12334567778888', 321919: '1344466666677777778888888', 172159: '134446778888', 260479: '1344455556666777888888', 214399: '1344455556667788888', 158079: '12334555667777777888', 106879: '134445567777788', 60799: '134445577778', 321279: '1233456666677777778888888', 316159: '13444666667777778888888', 270079: '13444666677777888888', 64639: '1344455556666677778', 329599: '13444555566788888888', 129279: '1233455566667888', 343039: '1344455777788888888', 245119: '13444556666888888', 309759: '123345666777778888888', 258559: '1344466777888888', 160639: '134446666667777777888', 283519: '13444555568888888', 30079: '13444555566666677777', 204159: '1233455566688888', 164479: '134445566668888', 273919: '134445566777777888888', 194559: '12334566667777778888', 45439: '1344478', 154879: '1344466666777777888', 295039: '134445555666778888888', 300799: '13444555566667778888888', 227199: '123345557777788888', 193279: '1344455667777778888', 199039: '134445566677777778888', 131199: '12334577888', 91519: '1344467788', 97279: '134446677788', 47359: '1344455556678', 104959: '13444555566666777788', 94719: '12334555666667788', 118399: '1344455666777777788', 175999: '1344455666666778888', 223359: '12334566777788888', 189439: '134446666777778888', 247039: '134447888888', 110719: '1344455556666667777788', 323839: '134445555688888888'}
+# sum_param_table, SUM_A and SUM_B are generated by euler_day_05.print_sum_params()
 sum_param_table = [13778659611992945312499999999916, 16534391534391534374999999999916, 22045855379188712499999999999916, 30313051146384479687499999999916, 41335978835978835937499999999916, 55114638447971781249999999999916, 71649029982363315624999999999916, 90939153439153439062499999999916, 112985008818342151562499999999916, 137786596119929453124999999999916, 165343915343915343749999999999916, 220458553791887124999999999999916, 303130511463844796874999999999916, 413359788359788359374999999999916, 551146384479717812499999999999916, 716490299823633156249999999999916, 909391534391534390624999999999916, 1129850088183421515624999999999916, 1377865961199294531249999999999916, 1653439153439153437499999999999916, 2204585537918871249999999999999916, 3031305114638447968749999999999916, 4133597883597883593749999999999916, 5511463844797178124999999999999916, 7164902998236331562499999999999916, 9093915343915343906249999999999916, 11298500881834215156249999999999916, 13778659611992945312499999999999916, 16534391534391534374999999999999916, 22045855379188712499999999999999916, 30313051146384479687499999999999916, 41335978835978835937499999999999916, 55114638447971781249999999999999916, 71649029982363315624999999999999916, 90939153439153439062499999999999916, 112985008818342151562499999999999916, 137786596119929453124999999999999916, 165343915343915343749999999999999916, 220458553791887124999999999999999916, 303130511463844796874999999999999916, 413359788359788359374999999999999916, 551146384479717812499999999999999916, 716490299823633156249999999999999916, 909391534391534390624999999999999916, 1129850088183421515624999999999999916, 1377865961199294531249999999999999916, 1653439153439153437499999999999999916, 2204585537918871249999999999999999916, 3031305114638447968749999999999999916, 4133597883597883593749999999999999916, 5511463844797178124999999999999999916, 7164902998236331562499999999999999916, 9093915343915343906249999999999999916, 11298500881834215156249999999999999916, 13778659611992945312499999999999999916, 16534391534391534374999999999999999916, 22045855379188712499999999999999999916, 30313051146384479687499999999999999916, 41335978835978835937499999999999999916, 55114638447971781249999999999999999916, 71649029982363315624999999999999999916, 90939153439153439062499999999999999916, 112985008818342151562499999999999999916, 137786596119929453124999999999999999916, 165343915343915343749999999999999999916, 220458553791887124999999999999999999916, 303130511463844796874999999999999999916, 413359788359788359374999999999999999916, 551146384479717812499999999999999999916, 716490299823633156249999999999999999916, 909391534391534390624999999999999999916, 1129850088183421515624999999999999999916, 1377865961199294531249999999999999999916, 1653439153439153437499999999999999999916, 2204585537918871249999999999999999999916, 3031305114638447968749999999999999999916, 4133597883597883593749999999999999999916, 5511463844797178124999999999999999999916, 7164902998236331562499999999999999999916, 9093915343915343906249999999999999999916, 11298500881834215156249999999999999999916, 13778659611992945312499999999999999999916, 16534391534391534374999999999999999999916, 22045855379188712499999999999999999999916, 30313051146384479687499999999999999999916, 41335978835978835937499999999999999999916, 55114638447971781249999999999999999999916, 71649029982363315624999999999999999999916, 90939153439153439062499999999999999999916, 112985008818342151562499999999999999999916, 137786596119929453124999999999999999999916, 165343915343915343749999999999999999999916, 220458553791887124999999999999999999999916, 303130511463844796874999999999999999999916, 413359788359788359374999999999999999999916, 551146384479717812499999999999999999999916, 716490299823633156249999999999999999999916, 909391534391534390624999999999999999999916, 1129850088183421515624999999999999999999916, 1377865961199294531249999999999999999999916, 1653439153439153437499999999999999999999916, 2204585537918871249999999999999999999999916, 3031305114638447968749999999999999999999916, 4133597883597883593749999999999999999999916, 5511463844797178124999999999999999999999916, 7164902998236331562499999999999999999999916, 9093915343915343906249999999999999999999916, 11298500881834215156249999999999999999999916, 13778659611992945312499999999999999999999916, 16534391534391534374999999999999999999999916, 22045855379188712499999999999999999999999916, 30313051146384479687499999999999999999999916, 41335978835978835937499999999999999999999916, 55114638447971781249999999999999999999999916, 71649029982363315624999999999999999999999916, 90939153439153439062499999999999999999999916, 112985008818342151562499999999999999999999916, 137786596119929453124999999999999999999999916, 165343915343915343749999999999999999999999916, 220458553791887124999999999999999999999999916, 303130511463844796874999999999999999999999916, 413359788359788359374999999999999999999999916, 551146384479717812499999999999999999999999916, 716490299823633156249999999999999999999999916, 909391534391534390624999999999999999999999916, 1129850088183421515624999999999999999999999916, 1377865961199294531249999999999999999999999916, 1653439153439153437499999999999999999999999916, 2204585537918871249999999999999999999999999916, 3031305114638447968749999999999999999999999916, 4133597883597883593749999999999999999999999916, 5511463844797178124999999999999999999999999916, 7164902998236331562499999999999999999999999916, 9093915343915343906249999999999999999999999916, 11298500881834215156249999999999999999999999916, 13778659611992945312499999999999999999999999916, 16534391534391534374999999999999999999999999916, 22045855379188712499999999999999999999999999916, 30313051146384479687499999999999999999999999916, 41335978835978835937499999999999999999999999916, 55114638447971781249999999999999999999999999916, 71649029982363315624999999999999999999999999916, 90939153439153439062499999999999999999999999916, 112985008818342151562499999999999999999999999916, 137786596119929453124999999999999999999999999916, 165343915343915343749999999999999999999999999916, 220458553791887124999999999999999999999999999916, 303130511463844796874999999999999999999999999916, 413359788359788359374999999999999999999999999916, 551146384479717812499999999999999999999999999916, 716490299823633156249999999999999999999999999916, 909391534391534390624999999999999999999999999916, 1129850088183421515624999999999999999999999999916, 1377865961199294531249999999999999999999999999916, 1653439153439153437499999999999999999999999999916, 2204585537918871249999999999999999999999999999916, 3031305114638447968749999999999999999999999999916, 4133597883597883593749999999999999999999999999916, 5511463844797178124999999999999999999999999999916, 7164902998236331562499999999999999999999999999916, 9093915343915343906249999999999999999999999999916, 11298500881834215156249999999999999999999999999916]
 SUM_A = 1000000000000000000
 SUM_B = 83999999999999999916
+LCM_GROUP_BITS = 256
 FACTORIALS = [math.factorial(i) for i in range(10)]
+DIGIT_CHARS = '0123456789'
+DIGIT_BYTES = b'0123456789'
 sg_table = [1, 2, 5, 6, 7, 3, 4, 5, 6, 7, 8, 8, 9, 13, 9, 10, 11, 13, 14, 15, 16, 17, 18, 13, 14, 15, 9, 10, 11, 12, 13, 14, 12, 13, 14, 15, 19, 28, 24, 25, 37, 31, 32, 45, 46, 50, 66, 67, 71, 84, 89, 90, 114, 118, 134, 154, 158, 193, 231, 235, 247, 317, 321, 545, 843, 1052, 1339, 1574, 1846, 2035, 2294, 2566, 5035, 7578, 9997, 12529, 15009, 17415, 19912, 22416, 24933, 49686, 74498, 99334, 124135, 148899, 173672, 198536, 223324, 248145, 496173, 744212, 992162, 1240190, 1488229, 1736179, 1984255, 2232318, 2480268, 4960419, 7440581, 9920765, 12400916, 14881015, 17361186, 19841385, 22321571, 24801707, 49603317, 74404903, 99206450, 124008025, 148809646, 173611193, 198412768, 223214413, 248015925, 496031816, 744047718, 992063594, 1240079422, 1488095324, 1736111200, 1984127056, 2232142919, 2480158795, 4960317556, 7440476328, 9920635039, 12400793737, 14880952509, 17361111207, 19841269933, 22321428666, 24801587412, 49603174707, 74404761998, 99206349313, 124007936656, 148809523899, 173611111214, 198412698494, 223214285824, 248015873187, 496031746194, 744047619212, 992063492204, 1240079365211, 1488095238229, 1736111111221, 1984126984276, 2232142857318, 2480158730310, 4960317460440, 7440476190581, 9920634920744, 12400793650874, 14880952381015, 17361111111165, 19841269841406, 22321428571571, 24801587301686, 49603174603275, 74404761904903, 99206349206429, 124007936508046, 148809523809646, 173611111111172, 198412698412789, 223214285714413, 248015873015967, 496031746031837, 744047619047718, 992063492063573, 1240079365079443, 1488095238095324, 1736111111111179, 1984126984127014, 2232142857142919, 2480158730158837, 4960317460317577, 7440476190476328, 9920634920635018, 12400793650793758, 14880952380952509, 17361111111111186, 19841269841269891, 22321428571428666, 24801587301587391, 49603174603174665, 74404761904761998, 99206349206349292, 124007936507936614, 148809523809523899, 173611111111111193, 198412698412698515, 223214285714285824, 248015873015873166, 496031746031746152, 744047619047619212, 992063492063492183, 1240079365079365169, 1488095238095238229, 1736111111111111200, 1984126984126984234, 2232142857142857318, 2480158730158730289, 4960317460317460398, 7440476190476190581, 9920634920634920723, 12400793650793650895, 14880952380952381015, 17361111111111111207, 19841269841269841364, 22321428571428571571, 24801587301587301665, 49603174603174603296, 74404761904761904903, 99206349206349206408, 124007936507936508004, 148809523809523809646, 173611111111111111214, 198412698412698412747, 223214285714285714413, 248015873015873015946, 496031746031746031795, 744047619047619047718, 992063492063492063552, 1240079365079365079464, 1488095238095238095324, 1736111111111111111221, 1984126984126984127035, 2232142857142857142919, 2480158730158730158816, 4960317460317460317535, 7440476190476190476328, 9920634920634920634997, 12400793650793650793779, 14880952380952380952509, 17361111111111111111165, 19841269841269841269912, 22321428571428571428666, 24801587301587301587433, 49603174603174603174686, 74404761904761904761998, 99206349206349206349334, 124007936507936507936635, 148809523809523809523899, 173611111111111111111172, 198412698412698412698536, 223214285714285714285824, 248015873015873015873145, 496031746031746031746173, 744047619047619047619212, 992063492063492063492162, 1240079365079365079365190, 1488095238095238095238229, 1736111111111111111111179, 1984126984126984126984255, 2232142857142857142857318, 2480158730158730158730268, 4960317460317460317460419, 7440476190476190476190581, 9920634920634920634920765, 12400793650793650793650916, 14880952380952380952381015, 17361111111111111111111186, 19841269841269841269841385, 22321428571428571428571571, 24801587301587301587301707, 49603174603174603174603317, 74404761904761904761904903, 99206349206349206349206450, 124007936507936507936508025, 148809523809523809523809646, 173611111111111111111111193, 198412698412698412698412768, 223214285714285714285714413, 248015873015873015873015925, 496031746031746031746031816, 744047619047619047619047718, 992063492063492063492063594, 1240079365079365079365079422, 1488095238095238095238095324, 1736111111111111111111111200, 1984126984126984126984127056, 2232142857142857142857142919, 2480158730158730158730158795, 4960317460317460317460317556, 7440476190476190476190476328, 9920634920634920634920635039, 12400793650793650793650793737, 14880952380952380952380952509, 17361111111111111111111111207, 19841269841269841269841269933, 22321428571428571428571428666, 24801587301587301587301587412, 49603174603174603174603174707, 74404761904761904761904761998, 99206349206349206349206349313, 124007936507936507936507936656, 148809523809523809523809523899, 173611111111111111111111111214, 198412698412698412698412698494, 223214285714285714285714285824, 248015873015873015873015873187, 496031746031746031746031746194, 744047619047619047619047619212, 992063492063492063492063492204, 1240079365079365079365079365211, 1488095238095238095238095238229, 1736111111111111111111111111221, 1984126984126984126984126984276, 2232142857142857142857142857318, 2480158730158730158730158730310, 4960317460317460317460317460440, 7440476190476190476190476190581, 9920634920634920634920634920744, 12400793650793650793650793650874, 14880952380952380952380952381015, 17361111111111111111111111111165, 19841269841269841269841269841406, 22321428571428571428571428571571, 24801587301587301587301587301686, 49603174603174603174603174603275, 74404761904761904761904761904903, 99206349206349206349206349206429, 124007936507936507936507936508046, 148809523809523809523809523809646, 173611111111111111111111111111172, 198412698412698412698412698412789, 223214285714285714285714285714413, 248015873015873015873015873015967, 496031746031746031746031746031837, 744047619047619047619047619047718, 992063492063492063492063492063573, 1240079365079365079365079365079443, 1488095238095238095238095238095324, 1736111111111111111111111111111179, 1984126984126984126984126984127014, 2232142857142857142857142857142919, 2480158730158730158730158730158837, 4960317460317460317460317460317577, 7440476190476190476190476190476328, 9920634920634920634920634920635018, 12400793650793650793650793650793758, 14880952380952380952380952380952509, 17361111111111111111111111111111186, 19841269841269841269841269841269891, 22321428571428571428571428571428666, 24801587301587301587301587301587391, 49603174603174603174603174603174665, 74404761904761904761904761904761998, 99206349206349206349206349206349292, 124007936507936507936507936507936614, 148809523809523809523809523809523899, 173611111111111111111111111111111193, 198412698412698412698412698412698515, 223214285714285714285714285714285824, 248015873015873015873015873015873166, 496031746031746031746031746031746152, 744047619047619047619047619047619212, 992063492063492063492063492063492183, 1240079365079365079365079365079365169, 1488095238095238095238095238095238229, 1736111111111111111111111111111111200, 1984126984126984126984126984126984234, 2232142857142857142857142857142857318, 2480158730158730158730158730158730289, 4960317460317460317460317460317460398, 7440476190476190476190476190476190581, 9920634920634920634920634920634920723, 12400793650793650793650793650793650895, 14880952380952380952380952380952381015, 17361111111111111111111111111111111207, 19841269841269841269841269841269841364, 22321428571428571428571428571428571571, 24801587301587301587301587301587301665, 49603174603174603174603174603174603296, 74404761904761904761904761904761904903, 99206349206349206349206349206349206408, 124007936507936507936507936507936508004, 148809523809523809523809523809523809646, 173611111111111111111111111111111111214, 198412698412698412698412698412698412747, 223214285714285714285714285714285714413, 248015873015873015873015873015873015946, 496031746031746031746031746031746031795, 744047619047619047619047619047619047718, 992063492063492063492063492063492063552, 1240079365079365079365079365079365079464, 1488095238095238095238095238095238095324, 1736111111111111111111111111111111111221, 1984126984126984126984126984126984127035, 2232142857142857142857142857142857142919, 2480158730158730158730158730158730158816, 4960317460317460317460317460317460317535, 7440476190476190476190476190476190476328, 9920634920634920634920634920634920634997, 12400793650793650793650793650793650793779, 14880952380952380952380952380952380952509, 17361111111111111111111111111111111111165, 19841269841269841269841269841269841269912, 22321428571428571428571428571428571428666, 24801587301587301587301587301587301587433, 49603174603174603174603174603174603174686, 74404761904761904761904761904761904761998, 99206349206349206349206349206349206349334, 124007936507936507936507936507936507936635, 148809523809523809523809523809523809523899, 173611111111111111111111111111111111111172, 198412698412698412698412698412698412698536, 223214285714285714285714285714285714285824, 248015873015873015873015873015873015873145, 496031746031746031746031746031746031746173, 744047619047619047619047619047619047619212, 992063492063492063492063492063492063492162, 1240079365079365079365079365079365079365190, 1488095238095238095238095238095238095238229, 1736111111111111111111111111111111111111179, 1984126984126984126984126984126984126984255, 2232142857142857142857142857142857142857318, 2480158730158730158730158730158730158730268, 4960317460317460317460317460317460317460419, 7440476190476190476190476190476190476190581, 9920634920634920634920634920634920634920765, 12400793650793650793650793650793650793650916, 14880952380952380952380952380952380952381015, 17361111111111111111111111111111111111111186, 19841269841269841269841269841269841269841385, 22321428571428571428571428571428571428571571, 24801587301587301587301587301587301587301707, 49603174603174603174603174603174603174603317, 74404761904761904761904761904761904761904903, 99206349206349206349206349206349206349206450, 124007936507936507936507936507936507936508025, 148809523809523809523809523809523809523809646, 173611111111111111111111111111111111111111193, 198412698412698412698412698412698412698412768, 223214285714285714285714285714285714285714413, 248015873015873015873015873015873015873015925, 496031746031746031746031746031746031746031816, 744047619047619047619047619047619047619047718, 992063492063492063492063492063492063492063594, 1240079365079365079365079365079365079365079422, 1488095238095238095238095238095238095238095324, 1736111111111111111111111111111111111111111200, 1984126984126984126984126984126984126984127056, 2232142857142857142857142857142857142857142919, 2480158730158730158730158730158730158730158795, 4960317460317460317460317460317460317460317556, 7440476190476190476190476190476190476190476328, 9920634920634920634920634920634920634920635039, 12400793650793650793650793650793650793650793737, 14880952380952380952380952380952380952380952509, 17361111111111111111111111111111111111111111207, 19841269841269841269841269841269841269841269933, 22321428571428571428571428571428571428571428666, 24801587301587301587301587301587301587301587412, 49603174603174603174603174603174603174603174707, 74404761904761904761904761904761904761904761998, 99206349206349206349206349206349206349206349313, 124007936507936507936507936507936507936507936656, 148809523809523809523809523809523809523809523899, 173611111111111111111111111111111111111111111214, 198412698412698412698412698412698412698412698494, 223214285714285714285714285714285714285714285824, 248015873015873015873015873015873015873015873187, 496031746031746031746031746031746031746031746194, 744047619047619047619047619047619047619047619212, 992063492063492063492063492063492063492063492204, 1240079365079365079365079365079365079365079365211, 1488095238095238095238095238095238095238095238229, 1736111111111111111111111111111111111111111111221, 1984126984126984126984126984126984126984126984276, 2232142857142857142857142857142857142857142857318, 2480158730158730158730158730158730158730158730310, 4960317460317460317460317460317460317460317460440, 7440476190476190476190476190476190476190476190581, 9920634920634920634920634920634920634920634920744, 12400793650793650793650793650793650793650793650874, 14880952380952380952380952380952380952380952381015, 17361111111111111111111111111111111111111111111165, 19841269841269841269841269841269841269841269841406, 22321428571428571428571428571428571428571428571571, 24801587301587301587301587301587301587301587301686, 49603174603174603174603174603174603174603174603275, 74404761904761904761904761904761904761904761904903, 99206349206349206349206349206349206349206349206429, 124007936507936507936507936507936507936507936508046, 148809523809523809523809523809523809523809523809646, 173611111111111111111111111111111111111111111111172, 198412698412698412698412698412698412698412698412789, 223214285714285714285714285714285714285714285714413, 248015873015873015873015873015873015873015873015967, 496031746031746031746031746031746031746031746031837, 744047619047619047619047619047619047619047619047718, 992063492063492063492063492063492063492063492063573, 1240079365079365079365079365079365079365079365079443, 1488095238095238095238095238095238095238095238095324]
-N_Number = namedtuple("N_Number", "prefix suffix_len")
 PREFIXES_SUM = 17460
+FRAME = 162
+BREAK_EVEN = 500
+G_FORMULA_MIN = 63
+CHUNK_SIZE = 1 << 20
+TABLES_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                          'hackerrank-euler')
+TABLES_PATH = os.environ.get('EULER_TABLES', os.path.join(TABLES_DIR, 'euler_day_06.tables'))
+TABLES_MAGIC = b'EU254T02'
+TABLES_MODE = os.environ.get('EULER_TABLES_MODE', 'full')
+TABLES_HEADER = struct.Struct('<8sIII')
+
+
+def minimal_prefix(f_prefix):
+    """
+    Return the smallest prefix (digits 1-8 in ascending order) such that f(prefix) = f_prefix.
+    Digits counts are digits of f_prefix written in factorial number system,
+    see euler_day_03.minimal_prefix for details.
+    """
+    counts = [0] * 9
+    for d in range(8, 0, -1):
+        counts[d], f_prefix = divmod(f_prefix, FACTORIALS[d])
+    return ''.join(str(d) * counts[d] for d in range(1, 9))
+
+
+def make_prefix_columns():
+    """
+    Build compact PREFIX table for every f_prefix from 0 to 9! - 1 as three arrays indexed by f_prefix:
+        counts - digits 1-8 counts of prefix packed by 4 bits (digit d count in bits 4*(d-1) .. 4*d-1)
+        digits_sums - sum of prefix digits
+        lengths - number of prefix digits
+    Columns are built digit by digit like euler_day_03.make_prefix_table: for digit d
+    the columns for digits 1..d-1 (indexes below d!) are repeated for every count of digit d from 0 to d.
+    :return: counts, digits_sums, lengths
+    """
+    counts, digits_sums, lengths = [0], [0], [0]
+    for d in range(1, 9):
+        shift = 4 * (d - 1)
+        counts = [c | j << shift for j in range(d + 1) for c in counts]
+        digits_sums = [s + j * d for j in range(d + 1) for s in digits_sums]
+        lengths = [ln + j for j in range(d + 1) for ln in lengths]
+    return array('I', counts), array('B', digits_sums), array('B', lengths)
+
+
+def prefix_column_values(f_prefix):
+    """ Solve PREFIX for f_prefix and return its packed counts, digits sum and length. """
+    packed = digits_sum_ = length = 0
+    for d in range(8, 0, -1):
+        count, f_prefix = divmod(f_prefix, FACTORIALS[d])
+        packed |= count << 4 * (d - 1)
+        digits_sum_ += count * d
+        length += count
+    return packed, digits_sum_, length
+
+
+class PrunedPrefixColumn(dict):
+    """
+    PREFIX column keeping values only for some f_prefix values.
+    Other values are solved on demand with prefix_column_values.
+    """
+    def __init__(self, values, column):
+        super().__init__(values)
+        self.column = column
+
+    def __missing__(self, f_prefix):
+        value = self[f_prefix] = prefix_column_values(f_prefix)[self.column]
+        return value
+
+
+def make_pruned_prefix_columns(max_i=None):
+    """
+    Build PREFIX columns only for f_prefix values reachable by g(i) for i up to max_i
+    (default len(sg_table)) plus the 162 cycle used by bigger i.
+    Few hundred entries instead of 9!, any other f_prefix is solved on demand.
+    :return: counts, digits_sums, lengths
+    """
+    max_i = max_i or len(sg_table)
+    reachable = {f_value_divmod(i)[1] for i in range(1, max_i + 1)}
+    reachable.update(f_value_divmod(i)[1] for i in range(2 * FRAME, 3 * FRAME))
+    values = {f_prefix: prefix_column_values(f_prefix) for f_prefix in reachable}
+    return tuple(PrunedPrefixColumn({f_prefix: v[column] for f_prefix, v in values.items()}, column)
+                 for column in range(3))
+
+
+def tables_header(counts, digits_sums, lengths):
+    """ Return sidecar header for columns given as little endian bytes: magic, 9!, counts item size, crc32 of columns. """
+    crc = zlib.crc32(lengths, zlib.crc32(digits_sums, zlib.crc32(counts)))
+    return TABLES_HEADER.pack(TABLES_MAGIC, F9, len(counts) // F9, crc)
+
+
+def make_tables_file(path=TABLES_PATH):
+    """
+    Write PREFIX columns into binary sidecar file (default in user cache directory, not in source tree).
+    File is header (magic, 9!, counts item size, crc32 of columns) followed by counts (little endian),
+    digits_sums and lengths columns. It is written to temporary file and renamed,
+    so concurrent readers never see partial file.
+    :param path: sidecar file name
+    """
+    counts, digits_sums, lengths = make_prefix_columns()
+    if sys.byteorder != 'little':
+        counts.byteswap()
+    columns = counts.tobytes(), digits_sums.tobytes(), lengths.tobytes()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(tables_header(*columns))
+        for column in columns:
+            file.write(column)
+    os.replace(tmp_path, path)
+
+
+def load_tables_file(path=TABLES_PATH):
+    """
+    Memory map PREFIX columns from sidecar file. Columns are returned as memoryviews on the mapped file,
+    so values are decoded only when they are accessed.
+    :param path: sidecar file name
+    :return: counts, digits_sums, lengths
+    :raise ValueError: file has wrong format or its checksum does not match
+    """
+    with open(path, 'rb') as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return tables_from_buffer(data, path)
+
+
+def tables_from_buffer(buffer, source):
+    """
+    Return PREFIX columns as views on buffer in sidecar file format (memory mapped file or shared memory block).
+    :param buffer: object supporting buffer protocol
+    :param source: buffer name for error message
+    :return: counts, digits_sums, lengths
+    :raise ValueError: buffer has wrong format or its checksum does not match
+    """
+    view = memoryview(buffer).toreadonly()
+    if len(view) < TABLES_HEADER.size:
+        raise ValueError(f'{source} is not valid tables file')
+    magic, size, item_size, crc = TABLES_HEADER.unpack_from(view)
+    pos = TABLES_HEADER.size
+    if magic != TABLES_MAGIC or size != F9 or len(view) < pos + size * (item_size + 2):
+        raise ValueError(f'{source} is not valid tables file')
+    if zlib.crc32(view[pos:pos + size * (item_size + 2)]) != crc:
+        raise ValueError(f'{source} tables checksum does not match, file is corrupted')
+    counts = view[pos:pos + size * item_size]
+    if sys.byteorder == 'little' and array('I').itemsize == item_size:
+        counts = counts.cast('I')
+    else:
+        counts = array('I', counts)
+        if sys.byteorder != 'little':
+            counts.byteswap()
+    pos += size * item_size
+    return counts, view[pos:pos + size], view[pos + size:pos + 2 * size]
+
+
+def publish_tables(engine=None, name=None):
+    """
+    Copy PREFIX columns of engine (default DEFAULT_ENGINE) into shared memory block in sidecar file format.
+    Worker processes attach to it by name (SgEngine(shared_name=...) or init_shared_worker) without copying,
+    so a pool of any size keeps one PREFIX in memory.
+    :param engine: engine with tables_mode 'full', for 'pruned' engine full columns are built
+    :param name: shared memory block name, default random name
+    :return: SharedMemory, caller closes and unlinks it when workers are done
+    """
+    from multiprocessing import shared_memory
+
+    engine = engine or DEFAULT_ENGINE
+    columns = engine.prefix_columns() if engine.tables_mode != 'pruned' else make_prefix_columns()
+    counts, digits_sums, lengths = (memoryview(column).cast('B') for column in columns)
+    if sys.byteorder != 'little':
+        counts = array('I', counts.cast('I'))
+        counts.byteswap()
+        counts = memoryview(counts).cast('B')
+    pos = TABLES_HEADER.size
+    shm = shared_memory.SharedMemory(name=name, create=True, size=pos + len(counts) + 2 * F9)
+    shm.buf[:pos] = tables_header(counts, digits_sums, lengths)
+    for column in counts, digits_sums, lengths:
+        shm.buf[pos:pos + len(column)] = column
+        pos += len(column)
+    return shm
+
+
+def init_shared_worker(name):
+    """ Process pool initializer: DEFAULT_ENGINE of worker uses PREFIX columns published by publish_tables. """
+    global DEFAULT_ENGINE
+    DEFAULT_ENGINE = SgEngine(shared_name=name)
+
+
+def lcm_groups(moduli, max_bits=LCM_GROUP_BITS):
+    """
+    Split distinct moduli into groups with lcm below 2**max_bits.
+    Arithmetic cost grows with modulus size, so one sum modulo lcm pays off only while lcm stays few words long.
+    Modulus bigger than the limit makes own group.
+    :param moduli: list of modulo values
+    :param max_bits: lcm bit length limit
+    :return: list of (group moduli, group lcm)
+    """
+    groups = []
+    group, lcm = [], 1
+    for m in dict.fromkeys(moduli):
+        merged = math.lcm(lcm, m)
+        if group and merged.bit_length() > max_bits:
+            groups.append((group, lcm))
+            group, merged = [], m
+        group.append(m)
+        lcm = merged
+    if group:
+        groups.append((group, lcm))
+    return groups
+
+
+class SgEngine:
+    """
+    Tables and caches for computing sg sums: PREFIX columns, PREFIX digits sum and f_value % 9! cycles
+    and exact sg prefix sums. Every table is built on first access under a lock and is read-only afterwards,
+    so one engine (and one loaded tables set) can serve queries from many threads.
+    Engines with different tables_path / tables_mode can live in one process.
+    Module level functions use DEFAULT_ENGINE.
+    """
+
+    def __init__(self, tables_path=TABLES_PATH, tables_mode=TABLES_MODE, shared_name=None):
+        """
+        :param tables_path: PREFIX columns sidecar file name
+        :param tables_mode: 'full' - all 9! prefixes from sidecar file, 'pruned' - only reachable prefixes
+        :param shared_name: name of shared memory block from publish_tables, PREFIX columns are attached from it
+        """
+        self.tables_path = tables_path
+        self.tables_mode = tables_mode
+        self.shared_name = shared_name
+        self._lock = threading.RLock()
+        self._tables = {}
+        # Set after _tables, so on engine release views on shared block are dropped before the block
+        self._shm = None
+
+    def close(self):
+        """ Drop all tables and detach shared memory block. Engine builds or attaches tables again when used. """
+        with self._lock:
+            self._tables = {}
+            if self._shm is not None:
+                self._shm.close()
+                self._shm = None
+
+    def _table(self, name, builder):
+        """ Return table name, builder is called only once even when many threads ask for it at the same time. """
+        table = self._tables.get(name)
+        if table is None:
+            with self._lock:
+                table = self._tables.get(name)
+                if table is None:
+                    table = self._tables[name] = builder()
+        return table
+
+    def prefix_columns(self):
+        """
+        Return PREFIX columns (counts, digits_sums, lengths). Loaded on first access from the sidecar file,
+        which is built when missing. When file can't be written columns are built in memory.
+        With tables_mode 'pruned' only reachable prefixes are kept and others are solved on demand.
+        """
+        return self._table('prefix_columns', self._load_prefix_columns)
+
+    def _load_prefix_columns(self):
+        if self.shared_name:
+            from multiprocessing import shared_memory
+
+            # Keep block referenced, columns are views on its buffer
+            self._shm = shared_memory.SharedMemory(name=self.shared_name)
+            return tables_from_buffer(self._shm.buf, self.shared_name)
+        if self.tables_mode == 'pruned':
+            return make_pruned_prefix_columns()
+        try:
+            return load_tables_file(self.tables_path)
+        except (OSError, ValueError):
+            try:
+                make_tables_file(self.tables_path)
+                return load_tables_file(self.tables_path)
+            except (OSError, ValueError):
+                return tuple(memoryview(column).toreadonly() for column in make_prefix_columns())
+
+    def sg_prefix_cycle(self):
+        """ Return PREFIX digits sum of g(i) for i % 162. """
+        return self._table('sg_prefix_cycle', lambda: tuple(make_sg_prefix_cycle(self.prefix_columns()[1])))
+
+    def frame_cycle_sums(self):
+        """
+        Return cumulative sums of PREFIX digits sum cycle and f_value % 9! cycle over two cycles.
+        Sum of cycle values for i in start..start+count-1 (count <= 162) is cum[start % 162 + count] - cum[start % 162].
+        """
+        return self._table('frame_cycle_sums', lambda: (tuple(accumulate(self.sg_prefix_cycle() * 2, initial=0)),
+                                                        tuple(accumulate(make_f_rem_cycle() * 2, initial=0))))
+
+    def sg_sums(self):
+        """
+        Return exact cumulative sums of sg, sg_sums[n] = sum of sg(i) for i <= n, up to BREAK_EVEN and sg_table end.
+        Sum_sg mod m for small n and head of big n is one lookup.
+        """
+        def build():
+            tail = [self.sg(i) for i in range(len(sg_table) + 1, BREAK_EVEN + 1)]
+            return tuple(accumulate(sg_table + tail, initial=0))
+        return self._table('sg_sums', build)
+
+    def prefix_counts(self, f_prefix):
+        """ Return list of digits counts of PREFIX for f_prefix, list[d] is count of digit d. """
+        packed = self.prefix_columns()[0][f_prefix]
+        return [0] + [packed >> 4 * (d - 1) & 15 for d in range(1, 9)]
+
+    def prefix_str(self, f_prefix):
+        """ Return PREFIX for f_prefix as str. """
+        counts = self.prefix_counts(f_prefix)
+        return ''.join(str(d) * counts[d] for d in range(1, 9))
+
+    def sg(self, i, m=None):
+        """
+        Define  sg(i) as the sum of the digits of g(i).
+        So sg(5) = 2 + 5 = 7 as g(5) = 25.
+        Outside sg_table g(i) is PREFIX followed by suffix_len digits 9 and PREFIX digits sum has cycle 162.
+        With m present it costs O(log i) for any i.
+        :param i:
+        :param m: if present - result modulo m
+        :return: sum digits of g(i)
+        """
+        if i <= len(sg_table):
+            sg_ = sg_table[i-1]
+            return sg_ % m if m else sg_
+        suffix_len, _ = f_value_divmod(i, m)
+        sg_ = self.sg_prefix_cycle()[i % FRAME] + suffix_len * 9
+        return sg_ % m if m else sg_
+
+    def sum_sg_mod_partial(self, start, stop, m, p_start=None):
+        """
+        Compute sum of sg(i) mod m for start <= i < stop, where start > len(sg_table) and stop - start <= 162.
+        PREFIX digits sums and f_value % 9! are taken from cycle sums, so sum of suffix_len is
+        (sum of f_value - sum of f_value % 9!) / 9! with f_value sum from f_values_sum.
+        Division by 9! is done with divisor_split, so for m coprime with 9! it works modulo m.
+        Power of 10 for stop is derived from start one, so it costs at most one pow.
+        :param start: range start
+        :param stop: range end (exclusive)
+        :param m: modulo
+        :param p_start: 10**(start // 9) modulo multiple of partial_mod(m) if already known
+        :return: sum mod m
+        """
+        count = stop - start
+        if count <= 0:
+            return 0
+        offset = start % FRAME
+        prefix_cum, rem_cum = self.frame_cycle_sums()
+        prefix_sum = prefix_cum[offset + count] - prefix_cum[offset]
+        rem_sum = rem_cum[offset + count] - rem_cum[offset]
+        u, w_inv = divisor_split(F9, m)
+        mm = m * u
+        p_start = pow(10, start // 9, mm) if p_start is None else p_start % mm
+        p_stop = p_start * 10 ** (stop // 9 - start // 9) % mm
+        f_sum = f_values_sum(stop, mm, p_stop) - f_values_sum(start, mm, p_start)
+        suffix_len_sum = (f_sum - rem_sum) % mm // u * w_inv
+        return (prefix_sum + 9 * suffix_len_sum) % m
+
+    def sum_sg_between(self, a, b, m):
+        """
+        Compute sum of sg(i) mod m for a <= i <= b.
+        Part covered by sg_sums is one lookup. Whole 162 frames from a are frames j0..j1-1 of frames starting
+        at base = 162 + a % 162, so numerator of their suffix_len sum is difference of sum_sg_suffix_len numerators:
+            b * (a**j1 - a**j0 - (a-1) * (j1 - j0)) + s * (a-1) * (a**j1 - a**j0)
+        The rest (less than 162 elements) goes to sum_sg_mod_partial. 10**18**j1 gives 10**k for the rest start,
+        so all of it costs pow for j0 and pow for window size modulo a small multiple of m.
+        :param a: range start
+        :param b: range end (inclusive)
+        :param m: modulo
+        :return: sum mod m
+        """
+        a = max(a, 1)
+        if b < a:
+            return 0
+        sg_sums = self.sg_sums()
+        limit = len(sg_sums) - 1
+        if b <= limit:
+            return (sg_sums[b] - sg_sums[a - 1]) % m
+        s = 0
+        if a <= limit:
+            s = sg_sums[limit] - sg_sums[a - 1]
+            a = limit + 1
+        steps = (b - a + 1) // FRAME
+        base = FRAME + a % FRAME
+        j0 = (a - base) // FRAME
+        j1 = j0 + steps
+        u, v_inv = sum_mod_params(SUM_A, m)
+        mm = math.lcm(m * u, partial_mod(m))
+        p0 = pow(SUM_A, j0, mm)
+        p1 = p0 * pow(SUM_A, steps, mm) % mm
+        if steps:
+            s0, am1 = sum_param_table[a % FRAME], SUM_A - 1
+            rq = (SUM_B * (p1 - p0 - am1 * steps) + s0 * am1 * (p1 - p0)) % (m * u)
+            s += rq // u * v_inv * 9 + steps * PREFIXES_SUM
+        s += self.sum_sg_mod_partial(a + steps * FRAME, b + 1, m, p1 * 10 ** (base // 9))
+        return s % m
+
+    def sum_sg_mod_old(self, n, m):
+        """ Compute sum_sg from 1 to n step by step. Values covered by sg_sums are taken from it. """
+        sg_sums = self.sg_sums()
+        cache_limit = len(sg_sums) - 1
+        s = sg_sums[min(cache_limit, n)] % m
+
+        if cache_limit >= n:
+            return s
+
+        ''' Start compute from i = cache_limit + 1. '''
+        for i in range(cache_limit + 1, n + 1):
+            s = (s + self.sg(i)) % m
+        return s
+
+    def sum_sg_mod(self, n, m):
+        """ Compute sum_sg from 1 to n mod m. """
+
+        sg_sums = self.sg_sums()
+        if n < BREAK_EVEN:
+            return sg_sums[n] % m
+        else:
+            start, steps = split_frames(n)
+            s = sg_sums[start - 1] % m
+            s += sum_sg_range(start, FRAME, steps, m)
+            return s % m
+
+    def sum_sg_mod_many(self, n, moduli):
+        """
+        Compute sum_sg from 1 to n for many moduli at once.
+        Frames split, head sum and sum_param_table lookup do not depend on modulus. Moduli are merged by lcm_groups
+        and frames sum is computed once per group modulo lcm of its moduli, then reduced for every modulus.
+        :param n: range end
+        :param moduli: iterable of modulo values
+        :return: list of sum_sg(n) mod m in moduli order
+        """
+        moduli = list(moduli)
+        sg_sums = self.sg_sums()
+        if n < BREAK_EVEN:
+            return [sg_sums[n] % m for m in moduli]
+        start, steps = split_frames(n)
+        head = sg_sums[start - 1]
+        results = {}
+        for group, lcm in lcm_groups(moduli):
+            s = head + sum_sg_range(start, FRAME, steps, lcm)
+            results.update((m, s % m) for m in group)
+        return [results[m] for m in moduli]
+
+    def sum_sg_mod_batch(self, queries):
+        """
+        Compute sum_sg_mod for many (n, m) queries at once.
+        Queries are grouped by n, every group is computed by one sum_sg_mod_many call
+        and duplicated (n, m) are computed once.
+        :param queries: list of (n, m) tuples
+        :return: list of results in queries order
+        """
+        by_n = defaultdict(set)
+        for n, m in queries:
+            by_n[n].add(m)
+
+        results = {}
+        for n, moduli in by_n.items():
+            moduli = list(moduli)
+            results.update(zip(((n, m) for m in moduli), self.sum_sg_mod_many(n, moduli)))
+        return [results[q] for q in queries]
+
+
+DEFAULT_ENGINE = SgEngine()
+
+
+def prefix_columns():
+    """ Return PREFIX columns (counts, digits_sums, lengths) of DEFAULT_ENGINE. """
+    return DEFAULT_ENGINE.prefix_columns()
+
+
+def __getattr__(name):
+    """ Module level access to lazily loaded tables. """
+    if name == 'PREFIX_COUNTS':
+        return prefix_columns()[0]
+    if name == 'PREFIX_DIGITS_SUM':
+        return prefix_columns()[1]
+    if name == 'PREFIX_LEN':
+        return prefix_columns()[2]
+    if name == 'sg_prefix_cycle':
+        return get_sg_prefix_cycle()
+    if name == 'sg_sums':
+        return get_sg_sums()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def prefix_counts(f_prefix):
+    """ Return list of digits counts of PREFIX for f_prefix, list[d] is count of digit d. """
+    return DEFAULT_ENGINE.prefix_counts(f_prefix)
+
+
+def prefix_str(f_prefix):
+    """ Return PREFIX for f_prefix as str. """
+    return DEFAULT_ENGINE.prefix_str(f_prefix)
 
 
 def init_prefixes():
-    """ Initialize. """
-    assert_sg(True)
+    """ Load PREFIX columns of DEFAULT_ENGINE ahead of first query. """
+    prefix_columns()
 
 
 def digits_gen(n):
@@ -45,12 +538,37 @@ def digits_gen(n):
             break
 
 
+def digit_counts(n):
+    """
+    Return counts of digits 0..9 in digit string n (str or bytes).
+    Every digit is counted by str.count / bytes.count at C speed, no int(n) conversion.
+    :param n: digit string
+    :return: list of 10 counts
+    :raise ValueError: n has not digit characters
+    """
+    counts = [n.count(d) for d in (DIGIT_CHARS if isinstance(n, str) else DIGIT_BYTES)]
+    if sum(counts) != len(n):
+        raise ValueError(f'{n[:20]!r} is not digit string')
+    return counts
+
+
+def f_and_digits_sum(n):
+    """
+    Return f(n) and digits sum of digit string n (str or bytes) computed from digit_counts(n).
+    For example f_and_digits_sum('342') = (32, 9)
+    """
+    counts = digit_counts(n)
+    return sum(c * FACTORIALS[d] for d, c in enumerate(counts)), sum(c * d for d, c in enumerate(counts))
+
+
 def digits_sum(n):
     """ Return sum of digits n. """
     if isinstance(n, int):
         return sum([d for d in digits_gen(n)])
-    elif isinstance(n, str):
-        return sum([int(ch) for ch in n])
+    elif isinstance(n, (str, bytes)):
+        return f_and_digits_sum(n)[1]
+    elif isinstance(n, N_Number):
+        return n.digits_sum()
     else:
         return sum([d for d in n.digits_gen()])
 
@@ -64,10 +582,32 @@ def f_value_with_digit_sum(n):
         return str(d) + '9' * n9
 
 
+def f_value_divmod(n, m=None):
+    """
+    Return divmod(f_value, 9!) for f_value = int(f_value_with_digit_sum(n)) without building f_value.
+    f_value is digit d followed by k digits 9, so it is equal (d + 1) * 10**k - 1 for k, d = divmod(n, 9).
+    When m is present quotient is returned mod m and computing costs O(log n).
+    :param n: digits sum of f_value
+    :param m: if present - quotient modulo m
+    :return: f_value // 9! (mod m), f_value % 9!
+    """
+    k, d = divmod(n, 9)
+    if m is None:
+        return divmod((d + 1) * 10 ** k - 1, F9)
+    mm = F9 * m
+    return divmod(((d + 1) * pow(10, k, mm) - 1) % mm, F9)
+
+
+def reverse_f_value_with_digit_sum(n):
+    """ Return number such that f(number) = int(f_value_with_digit_sum(n)). """
+    suffix_len, f_prefix = f_value_divmod(n)
+    return N_Number(prefix_str(f_prefix), suffix_len)
+
+
 def reverse_f(f_value):
     """ Return number such that f(number) = f_value. """
     suffix_len, f_prefix = divmod(f_value, F9)
-    prefix = PREFIX[f_prefix]
+    prefix = prefix_str(f_prefix)
     return N_Number(prefix, suffix_len)
 
 
@@ -79,12 +619,14 @@ def f(n):
     :param n: number
     :return: sum digits factorial of n
     """
-    if isinstance(n, str):
-        n = int(n)
+    if isinstance(n, (str, bytes)):
+        return f_and_digits_sum(n)[0]
     if isinstance(n, int):
         return sum([FACTORIALS[d] for d in digits_gen(n)])
     elif isinstance(n, list):
         return sum([FACTORIALS[d] for d in n])
+    elif isinstance(n, N_Number):
+        return n.f()
     else:
         return sum([FACTORIALS[d] for d in n.digits_gen()])
 
@@ -103,42 +645,236 @@ def sf(n):
     return sf_
 
 
+@total_ordering
+class N_Number:
+    """
+    Number n kept in run length form as prefix followed by suffix_len digits 9.
+    Prefix is normalized to not end with digit 9. Number value is never expanded,
+    so every operation costs O(len(prefix)) or O(log suffix_len).
+    """
+    __slots__ = ('prefix', 'suffix_len')
+
+    def __init__(self, prefix, suffix_len=0):
+        stripped = prefix.rstrip('9')
+        self.prefix = stripped
+        self.suffix_len = suffix_len + len(prefix) - len(stripped)
+
+    def __repr__(self):
+        return f'N_Number({self.prefix!r}, {self.suffix_len})'
+
+    def __str__(self):
+        """ Return number value as str. Materializes the whole number. """
+        return self.prefix + '9' * self.suffix_len
+
+    def __int__(self):
+        """ Return number value as int. Materializes the whole number. """
+        p = 10 ** self.suffix_len
+        return int(self.prefix or '0') * p + p - 1
+
+    def __iter__(self):
+        """ Allow unpacking as prefix, suffix_len pair. """
+        yield self.prefix
+        yield self.suffix_len
+
+    def __len__(self):
+        return self.length()
+
+    def __eq__(self, other):
+        if not isinstance(other, N_Number):
+            return NotImplemented
+        return self.prefix == other.prefix and self.suffix_len == other.suffix_len
+
+    def __lt__(self, other):
+        if not isinstance(other, N_Number):
+            return NotImplemented
+        if self.length() != other.length():
+            return self.length() < other.length()
+        p_len = max(len(self.prefix), len(other.prefix))
+        return self.prefix.ljust(p_len, '9') < other.prefix.ljust(p_len, '9')
+
+    def __hash__(self):
+        return hash((self.prefix, self.suffix_len))
+
+    def length(self):
+        """ Return number of digits. """
+        return len(self.prefix) + self.suffix_len
+
+    def digits_sum(self):
+        """ Return sum of digits. """
+        return digits_sum(self.prefix) + 9 * self.suffix_len
+
+    def f(self):
+        """ Return sum of digits factorial. """
+        return (f(self.prefix) if self.prefix else 0) + F9 * self.suffix_len
+
+    def sf(self):
+        """ Return sum of digits of f. """
+        return digits_sum(self.f())
+
+    def mod(self, m):
+        """ Return number value mod m. """
+        p = pow(10, self.suffix_len, m)
+        return (int(self.prefix or '0') * p + p - 1) % m
+
+    def write(self, file, start=0, stop=None, chunk_size=CHUNK_SIZE):
+        """
+        Stream decimal expansion of number to binary file using constant memory.
+        :param file: binary file object
+        :param start: first digit position to write
+        :param stop: position after the last digit to write, default end of number
+        :param chunk_size: max size of single write
+        :return: number of bytes written
+        """
+        length = self.length()
+        stop = length if stop is None else min(stop, length)
+        written = 0
+        if start < len(self.prefix) and start < stop:
+            part = self.prefix[start:stop].encode()
+            file.write(part)
+            written += len(part)
+            start = len(self.prefix)
+        nines = stop - max(start, len(self.prefix))
+        chunk = b'9' * min(chunk_size, max(nines, 0))
+        while nines > 0:
+            part = chunk if nines >= len(chunk) else chunk[:nines]
+            file.write(part)
+            written += len(part)
+            nines -= len(part)
+        return written
+
+
 def g(i):
     """
     Define g(i) to be the smallest positive integer n such that sf(n) == i.
     sf(342) = 5, also sf(25) = 5 and 25 is the smallest number giving sf(i) = 5, so g(5) = 25
-    Using cached value. g_sequence with parameter not less than i must be called earlier
+    Computed by formula, which gives the smallest n for i >= G_FORMULA_MIN only.
     :param i: number
     :return: the smallest n such that sf(n) == i in as N_Number tuple
     """
-    f_value = f_value_with_digit_sum(i)
-    best_n = reverse_f(int(f_value))
-    return best_n
+    return reverse_f_value_with_digit_sum(i)
 
 
-def sg(i):
+def write_g(i, target, start=0, stop=None, chunk_size=CHUNK_SIZE):
     """
-    Define  sg(i) as the sum of the digits of g(i).
-    So sg(5) = 2 + 5 = 7 as g(5) = 25.
-    :param i:
-    :return: sum digits of g(i)
+    Stream decimal expansion of g(i) (or its digits range start:stop) in chunks.
+    :param i: number
+    :param target: binary file object, file descriptor or file name
+    :param start: first digit position to write
+    :param stop: position after the last digit to write, default end of g(i)
+    :param chunk_size: max size of single write
+    :return: number of bytes written
+    :raise ValueError: i < G_FORMULA_MIN, g(i) formula gives the smallest n only from there
     """
-    if i <= len(sg_table):
-        return sg_table[i-1]
-    else:
-        n = g(i)
-        return digits_sum(n.prefix) + n.suffix_len * 9
+    if i < G_FORMULA_MIN:
+        raise ValueError(f'g({i}) is not computed by formula, i must be at least {G_FORMULA_MIN}')
+    n = g(i)
+    if hasattr(target, 'write'):
+        return n.write(target, start, stop, chunk_size)
+    with open(target, 'wb', closefd=not isinstance(target, int)) as file:
+        return n.write(file, start, stop, chunk_size)
+
+
+def sg(i, m=None):
+    """ Return sg(i) (mod m) computed by DEFAULT_ENGINE. """
+    return DEFAULT_ENGINE.sg(i, m)
+
+
+def make_sg_prefix_cycle(digits_sums=None):
+    """ Build PREFIX digits sum of g(i) for i % 162 from the stable part of the cycle. """
+    if digits_sums is None:
+        digits_sums = prefix_columns()[1]
+    cycle = [0] * FRAME
+    for i in range(2 * FRAME, 3 * FRAME):
+        cycle[i % FRAME] = digits_sums[f_value_divmod(i)[1]]
+    return cycle
+
+
+def get_sg_prefix_cycle():
+    """ Return PREFIX digits sum cycle of DEFAULT_ENGINE. """
+    return DEFAULT_ENGINE.sg_prefix_cycle()
+
+
+def make_f_rem_cycle():
+    """ Build f_value % 9! of g(i) for i % 162 from the stable part of the cycle. """
+    cycle = [0] * FRAME
+    for i in range(2 * FRAME, 3 * FRAME):
+        cycle[i % FRAME] = f_value_divmod(i)[1]
+    return cycle
+
+
+def get_frame_cycle_sums():
+    """ Return PREFIX digits sum and f_value % 9! cycles cumulative sums of DEFAULT_ENGINE. """
+    return DEFAULT_ENGINE.frame_cycle_sums()
+
+
+def get_sg_sums():
+    """ Return exact cumulative sums of sg of DEFAULT_ENGINE. """
+    return DEFAULT_ENGINE.sg_sums()
 
 
 def g_suffix_len(i):
     """ Return number of digits 9 in g(i). """
-    f_value = f_value_with_digit_sum(i)
-    return reverse_f(int(f_value)).suffix_len
+    return f_value_divmod(i)[0]
+
+
+@lru_cache(maxsize=1024)
+def divisor_split(v, m):
+    """
+    Split divisor v = u * w where u has only prime factors of m and gcd(w, m) == 1.
+    Cached for recently used moduli only, so many distinct moduli do not grow memory.
+    Exact quotient x / v mod m is then ((x mod m * u) // u) * inverse(w) mod m.
+    :param v: divisor
+    :param m: modulo value
+    :return: u, inverse of w mod m
+    """
+    w, u = v, 1
+    g = math.gcd(w, m)
+    while g > 1:
+        w //= g
+        u *= g
+        g = math.gcd(w, g)
+    return u, pow(w, -1, m) if m > 1 else 0
+
+
+def sum_mod_params(a, m):
+    """
+    Split (a-1)**2 with divisor_split.
+    Numerator of frames sum is then computed modulo m * u only and divided by v with modular inverse.
+    For m coprime with a-1 (most primes, 10**18) u == 1 and all arithmetic is done modulo m.
+    :param a: increase sum parameter 1
+    :param m: modulo value
+    :return: u, inverse of v mod m
+    """
+    return divisor_split((a - 1) * (a - 1), m)
 
 
 def sum_sg_suffix_len(s, a, b, n, m):
     """
-    Compute expression for sum_sg mod m for n elements.
+    Compute expression for sum_sg mod m for n elements with (a-1)**2 split by sum_mod_params.
+    Numerator is computed modulo m * u, divided by u exactly and multiplied by inverse of v mod m.
+    The split is exact for any m, for m coprime with a-1 (u == 1) all arithmetic stays modulo m.
+    :param s: value for the first sum element
+    :param a: increase sum parameter 1
+    :param b: incresae sum parameter 2
+    :param n: sum size
+    :param m: modulo value
+    :return: sum_sg for n frames
+    """
+    u, v_inv = sum_mod_params(a, m)
+    mm = m * u
+    a, b, s = a % mm, b % mm, s % mm
+    an = pow(a, n, mm)
+    rq = (b * (an - a * (n % mm) + n - 1) + s * (a - 1) * (an - 1)) % mm
+    return rq // u * v_inv % m
+
+
+def sum_sg_suffix_len_big(s, a, b, n, m):
+    """
+    Compute expression for sum_sg mod m for n elements without split, reference for sum_sg_suffix_len.
+    Sum of n frames is (b * (a**n - a*n + n - 1) + s * (a-1) * (a**n - 1)) / (a-1)**2.
+    Numerator is divisible by (a-1)**2, so it is computed modulo m * (a-1)**2
+    and divided by (a-1)**2 at the end. It works even when a-1 is not invertible mod m
+    and costs O(log n) multiplications.
     :param s: value for the first sum element
     :param a: increase sum parameter 1
     :param b: incresae sum parameter 2
@@ -146,13 +882,11 @@ def sum_sg_suffix_len(s, a, b, n, m):
     :param m: modulo value
     :return: sum_sg for n frames
     """
-    # print(f'{__name__}: n={n}, m={m}, a={a}, b={b}\ns={s}')
     am1sqr = (a - 1) * (a - 1)
-    an = a ** n
-    q1 = b * (an - a * n + n - 1) // am1sqr
-    q2 = s * (an - 1) // (a - 1)
-    rq = (q1 + q2) % m
-    return rq
+    mm = m * am1sqr
+    an = pow(a, n, mm)
+    rq = (b * (an - a * n % mm + n - 1) + s * (a - 1) * (an - 1)) % mm
+    return rq // am1sqr
 
 
 def sum_sg_range(start, frame, steps, m):
@@ -175,82 +909,149 @@ def sum_sg_range(start, frame, steps, m):
     return (suffix_part + prefix_part) % m
 
 
+def f_values_sum(n, mm, p=None):
+    """
+    Compute sum of f_value = (d + 1) * 10**k - 1 for all digits sums i < n modulo mm, k, d = divmod(i, 9).
+    Every full 9 elements group k adds 45 * 10**k - 9, so groups below k sum up to 5 * (10**k - 1) - 9 * k.
+    :param n: range end (exclusive)
+    :param mm: modulo
+    :param p: 10**(n // 9) mod mm if already known
+    :return: sum mod mm
+    """
+    k, d = divmod(n, 9)
+    if p is None:
+        p = pow(10, k, mm)
+    return (5 * (p - 1) - 9 * k + p * (d * (d + 1) // 2) - d) % mm
+
+
+def sum_sg_mod_partial(start, stop, m, p_start=None):
+    """ Return sum of sg(i) mod m for start <= i < stop computed by DEFAULT_ENGINE. """
+    return DEFAULT_ENGINE.sum_sg_mod_partial(start, stop, m, p_start)
+
+
+def partial_mod(m):
+    """ Return modulus used by sum_sg_mod_partial for summing f_values. """
+    return m * divisor_split(F9, m)[0]
+
+
+def sum_sg_between(a, b, m):
+    """ Return sum of sg(i) mod m for a <= i <= b computed by DEFAULT_ENGINE. """
+    return DEFAULT_ENGINE.sum_sg_between(a, b, m)
+
+
 def sum_sg_range_test(start, frames, steps, m):
     print(f'Range sum test from {n} up to {n + frames * steps} ({frames} * {steps})')
     s = sum_sg_range(start, frames, steps, m)
     t = 0
     for i in range(frames * steps):
-        g_ = g(start + i)
-        t += g_.suffix_len * 9 + digits_sum(g_.prefix)
+        t += g(start + i).digits_sum()
     if s % m != t % m:
         print(f"Fail with computing sum sg - is vs expected: \n{s}\n{t}")
 
 
 def sum_sg_mod_old(n, m):
-    """ Compute sum_sg from 1 to n step by step. """
+    """ Return sum_sg from 1 to n mod m computed step by step by DEFAULT_ENGINE. """
+    return DEFAULT_ENGINE.sum_sg_mod_old(n, m)
 
-    ''' 
-    Split sg_table at position cache_limit.
-        The first part used for setting up initial values of sg(i). Minimum 70 is required for having stable prefix..
-        The second part is used for verifying result of new get_sg against data in sg_table.
-    '''
-    cache_limit = min(490, len(sg_table))
 
+def sum_sg_mod_old_chunk(start, stop, m):
+    """ Compute sum of sg(i) mod m for start < i <= stop step by step. """
     s = 0
-    s = sum(sg_table[:min(cache_limit, n)]) % m
+    for i in range(start + 1, stop + 1):
+        s = (s + sg(i, m)) % m
+    return s
 
-    if cache_limit >= n:
-        return s
 
-    ''' Start compute from i = cache_limit + 1. '''
-    for i in range(cache_limit + 1, n + 1):
-        s = (s + sg(i)) % m
+def sum_sg_mod_old_parallel(n, m, workers=None, chunks=None):
+    """
+    Compute sum_sg from 1 to n step by step with range split into chunks summed in a process pool.
+    :param n: range end
+    :param m: modulo
+    :param workers: number of processes, default number of CPUs
+    :param chunks: number of chunks, default 4 chunks per worker
+    :return: sum_sg(n) mod m
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    sg_sums = get_sg_sums()
+    cache_limit = len(sg_sums) - 1
+    if n <= cache_limit:
+        return sg_sums[n] % m
+    workers = workers or os.cpu_count()
+    chunks = min(chunks or 4 * workers, n - cache_limit)
+    bounds = [cache_limit + (n - cache_limit) * j // chunks for j in range(chunks + 1)]
+    s = sg_sums[cache_limit] % m
+    # PREFIX is built once here and attached by every worker
+    shm = publish_tables()
+    try:
+        with ProcessPoolExecutor(workers, initializer=init_shared_worker, initargs=(shm.name,)) as executor:
+            for part in executor.map(sum_sg_mod_old_chunk, bounds[:-1], bounds[1:], repeat(m)):
+                s = (s + part) % m
+    finally:
+        shm.close()
+        shm.unlink()
     return s
 
 
 def sum_sg_mod(n, m):
-    """ Compute sum_sg from 1 to n mod m. """
+    """ Return sum_sg from 1 to n mod m computed by DEFAULT_ENGINE. """
+    return DEFAULT_ENGINE.sum_sg_mod(n, m)
 
-    break_even = 500
-    if n < break_even:
-        return sum_sg_mod_old(n, m) % m
-    else:
-        frame = 162
-        steps = (n + 1 - 162) // frame
-        start = (n + 1 - steps * 162)
-        s = sum_sg_mod_old(start-1, m) % m
-        s += sum_sg_range(start, frame, steps, m)
-        return s % m
+
+def sum_sg_mod_many(n, moduli):
+    """ Return sum_sg from 1 to n for many moduli computed by DEFAULT_ENGINE. """
+    return DEFAULT_ENGINE.sum_sg_mod_many(n, moduli)
+
+
+def split_frames(n):
+    """
+    Split range 1..n into head 1..start-1 and steps frames of FRAME elements.
+    Start depends only on (n + 1) % FRAME so all n from the same residue class share the head.
+    :param n: range end
+    :return: start, steps
+    """
+    steps = (n + 1 - FRAME) // FRAME
+    start = (n + 1 - steps * FRAME)
+    return start, steps
+
+
+def sum_sg_mod_batch(queries):
+    """ Return sum_sg_mod for many (n, m) queries computed by DEFAULT_ENGINE. """
+    return DEFAULT_ENGINE.sum_sg_mod_batch(queries)
+
+
+def read_queries(stream=None):
+    """
+    Read all queries as bytes at once and parse them in bulk.
+    :param stream: binary stream, default stdin
+    :return: list of (n, m) tuples, empty for empty input
+    """
+    data = (stream or sys.stdin.buffer).read().split()
+    if not data:
+        return []
+    q = int(data[0])
+    values = list(map(int, data[1:2 * q + 1]))
+    return list(zip(values[0::2], values[1::2]))
+
+
+def write_answers(answers, stream=None):
+    """ Write all answers with one buffered write, nothing for no answers. """
+    if answers:
+        (stream or sys.stdout).write('\n'.join(map(str, answers)) + '\n')
 
 
 def sum_sg(n):
     """ Compute using iterative way sum_sg from 1 to n. """
-    s = 0
-    s = sum(sg_table[0:min(len(sg_table), n)])
+    sg_sums = get_sg_sums()
+    s = sg_sums[min(len(sg_sums) - 1, n)]
 
-    for i in range(len(sg_table) + 1, n + 1):
+    for i in range(len(sg_sums), n + 1):
         s = (s + sg(i))
     return s
 
 
-def assert_sg(cache=None):
-    for i, sg_sum in enumerate(sg_table, 1):
-        if sg_cache.get(i):
-            if sg_cache.get(i) != sg_sum:
-                print(f'Assertion error sg({i}) is {sg_cache.get(i, 0)} while expected {sg_sum}')
-        else:
-            if cache:
-                sg_cache[i] = sg_sum
-
-
 def hacker_main():
-    init_prefixes()
-    assert_sg(cache=True)
-    q = int(input())
-    for _ in range(q):
-        n, m = map(int, input().split())
-        r = sum_sg_mod(n, m)
-        print(r)
+    write_answers(sum_sg_mod_batch(read_queries()))
 
 
 def development_main(size=200, mod=None):
@@ -268,9 +1069,59 @@ def development_main(size=200, mod=None):
     pgm_stop = time.perf_counter()
     print(f"sum_sg({size}) has length {len(str(total))} last digits are {total % 1000000000000000} "
           f"computed in {pgm_stop - pgm_start:.2f} seconds")
-    assert_sg()
 
 
+def benchmark_startup(runs=5, query='10**18 1000000007'):
+    """
+    Measure wall time of short-lived process importing this module and answering one query.
+    The first run builds the sidecar tables file when it is missing.
+    """
+    import subprocess
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    n, m = query.split()
+    code = ('import time; t = time.perf_counter(); import euler_day_06 as e; t_import = time.perf_counter() - t; '
+            f'e.sum_sg_mod({n}, {m}); '
+            'print(f"{t_import:.4f} {time.perf_counter() - t:.4f}")')
+    for run in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', code], cwd=module_dir, capture_output=True, text=True)
+        stop = time.perf_counter()
+        t_import, t_query = result.stdout.split()
+        print(f'Run {run}: import {float(t_import) * 1000:.1f} ms, import + query {float(t_query) * 1000:.1f} ms, '
+              f'process {(stop - start) * 1000:.1f} ms')
+
+
+def benchmark_mod_paths(moduli=(2**30 - 1, 10**9 + 7, 10**18, 2**127 - 1), sizes=(10**6, 10**18, 10**100),
+                        number=2000):
+    """ Compare sum_sg_suffix_len against sum_sg_suffix_len_big for different modulus and sum sizes. """
+    import timeit
+    s, a, b = sum_param_table[0], SUM_A, SUM_B
+    for m in moduli:
+        for n in sizes:
+            assert sum_sg_suffix_len(s, a, b, n, m) == sum_sg_suffix_len_big(s, a, b, n, m)
+            t_split = timeit.timeit(lambda: sum_sg_suffix_len(s, a, b, n, m), number=number) / number
+            t_big = timeit.timeit(lambda: sum_sg_suffix_len_big(s, a, b, n, m), number=number) / number
+            print(f'm={m} n=10**{len(str(n)) - 1}: split {t_split * 1e6:.1f} us, big {t_big * 1e6:.1f} us, '
+                  f'speedup {t_big / t_split:.1f}x')
+
+
+def benchmark_mod_many(counts=(2, 16, 1000, 10000), n=10**18, seed=1):
+    """ Compare sum_sg_mod_many against sum_sg_mod for every modulus for random 30 bits moduli. """
+    import random
+    rnd = random.Random(seed)
+    for count in counts:
+        moduli = [rnd.randrange(2**29, 2**30) | 1 for _ in range(count)]
+        divisor_split.cache_clear()
+        start = time.perf_counter()
+        many = sum_sg_mod_many(n, moduli)
+        t_many = time.perf_counter() - start
+        divisor_split.cache_clear()
+        start = time.perf_counter()
+        assert many == [sum_sg_mod(n, m) for m in moduli]
+        t_loop = time.perf_counter() - start
+        print(f'{count} moduli: many {t_many * 1000:.2f} ms, every modulus {t_loop * 1000:.2f} ms, '
+              f'groups {len(lcm_groups(moduli))}')
+
 if __name__ == "__main__":
     # DEBUG = True
     # hacker_main()
@@ -300,5 +1151,30 @@ sum_sg(5000000000) has length 12 last digits are 785396820556 computed in 2.70 s
 sum_sg(100000000000000000000000000000000000000000000000000)  
 last digits are 380952380947918 computed in 0.00 seconds
 
-"""
+PREFIX columns memory-mapped from euler_day_06.tables sidecar (user cache directory) and loaded on first access (benchmark_startup):
+import euler_day_06 before 130 ms, after 10 ms (cached bytecode, multiprocessing imported only by parallel code)
+one query process (import + sum_sg_mod(10**18, 10**9 + 7)) 30 ms
+
+sum_sg_suffix_len with (a-1)**2 split vs modulo m * (a-1)**2 (benchmark_mod_paths, n=10**18):
+m=2**30-1 split 17.7 us, big 23.4 us; m=10**9+7 split 5.5 us, big 27.1 us; m=10**18 split 3.2 us, big 25.5 us;
+m=2**127-1 split 31.1 us, big 50.4 us
 
+sum_sg_between(10**17 + 3, 10**18, m) in one call: m=10**9+7 15.4 us, m=10**18 9.4 us
+(sum_sg_mod(10**18, m) - sum_sg_mod(10**17 + 2, m) 15.6 us and 8.2 us - window needs two independent powers)
+narrow window sum_sg_between(10**18 - 1000, 10**18, m): m=10**9+7 12.1 us, m=10**18 8.3 us
+
+sum_sg_mod_many(10**18, moduli) vs sum_sg_mod for every modulus:
+10**1..10**18 (lcm 10**18) 13.0 us vs 77.1 us
+random 30 bits moduli: 2 - 29.6 us vs 35.8 us, 4 - 55.1 us vs 88.3 us, 16 - 97.8 us vs 218.1 us
+moduli merged while lcm < 2**256 (lcm_groups, benchmark_mod_many): 1000 random 30 bits moduli 8.3 ms vs 20.7 ms, 10000 - 87 ms vs 239 ms
+
+SgEngine owns all tables, module functions go through DEFAULT_ENGINE:
+sum_sg_mod(10**18, 10**9 + 7) module 9.3 us, own engine 10.2 us; 8 threads share one engine and one tables set
+
+PREFIX columns published once in shared memory (publish_tables, 2.2 MB), pool workers attach by name:
+worker building own PREFIX in memory 141 ms and 2.2 MB each, attaching 0.2 ms and no copy
+
+f and digits_sum of digit string (str / bytes) from digit counts (str.count / bytes.count):
+10**5 digits f 2.4 ms (int(s) and digits_gen 10.3 s), 10**6 digits f 25 ms, digits_sum 23 ms (per char 231 ms)
+
+"""
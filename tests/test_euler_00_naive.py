@@ -6,6 +6,8 @@ def test_d0_f():
     assert e.f(342) == 32
     assert e.f(5) == 120
     assert e.f(25) == 122
+    assert e.f('342') == 32
+    assert e.f('1' * 5000) == 5000
 
 
 def test_d0_sf():
@@ -71,3 +73,21 @@ def test_d0_sum_sg():
     assert e.sum_sg(10) == 46
     assert e.sum_sg(20) == 156
     assert e.sum_sg(40) == 468
+
+
+def test_d0_digit_primitives():
+    big = 7 ** 20000
+    assert e.digits_sum(0) == 0
+    assert e.digits_sum(245) == 11
+    assert e.digits_sum('245') == 11
+    assert e.digits_sum(10 ** 5000 - 1) == 9 * 5000
+    assert e.int_limbs(1234567) == [4567, 123]
+    assert e.int_limbs(10 ** 8) == [0, 0, 1]
+    assert e.digits_count(big) == 16902
+    assert [e.digits_count(n) for n in [0, 9, 10, 99, 100, 10 ** 300 - 1, 10 ** 300]] == [1, 1, 2, 2, 3, 300, 301]
+    assert e.first_digits(34256, 2) == 34
+    assert e.first_digits(34256, 9) == 34256
+    assert e.last_digits(34256, 2) == 56
+    assert e.first_digits(big, 5) * 10 ** (16902 - 5) <= big < (e.first_digits(big, 5) + 1) * 10 ** (16902 - 5)
+    n = 98765432109876543210 ** 7
+    assert e.digits_sum(n) == sum(int(ch) for ch in str(n))
@@ -90,3 +90,18 @@ def test_d1_sg():
     assert sg(44) == 45
 
 
+def test_d1_limb_tables():
+    assert e.LIMB_F[7] == 3 + 5040 and e.LIMB_TOP_F[7] == 5040
+    for n in [0, 1, 10, 1000, 10000, 100010, 342, 12378889, 10 ** 20 + 5, 7 ** 50]:
+        assert e.f(n) == sum(e.FACTORIALS[int(ch)] for ch in str(n))
+        assert e.f(str(n)) == e.f(Digits(n)) == e.f(n)
+        assert e.digits_sum(n) == e.digits_sum(str(n)) == sum(int(ch) for ch in str(n))
+
+
+def test_d1_digit_counts_next():
+    assert [int(e.DigitCounts(n).next()) for n in [1, 9, 11, 19, 29, 89, 99, 1299]] == [2, 11, 12, 22, 33, 99, 111, 1333]
+    a, b = Digits(1), e.DigitCounts(1)
+    for _ in range(5000):
+        assert str(a) == str(b) and e.f(a) == e.f(b) == e.f(int(b))
+        a.next()
+        b.next()
@@ -42,5 +42,19 @@ def test_d2_digits_next():
     assert False
 
 
-
-
+def test_d2_limb_tables():
+    # sf goes through both tables, numbers around 10**4 limb boundaries
+    for n in [9999, 10000, 10001, 99990000, 100009999, 12378889]:
+        assert e.sf(n) == sum(int(ch) for ch in str(sum(e.FACTORIALS[int(ch)] for ch in str(n))))
+
+
+def test_d2_digit_counts_next():
+    assert [int(e.DigitCounts(n).next()) for n in [1, 9, 99, 122, 1229, 2599, 12233399]] == [2, 12, 122, 123, 1233, 2666, 12233444]
+    # candidates grow, keep PREFIX limits (digit d < 9 at most d times) and incremental f_value
+    n = e.DigitCounts(1)
+    last = 0
+    for _ in range(5000):
+        assert int(n) > last and all(n.counts[d] <= d for d in range(9))
+        assert n.f_value == e.f(int(n))
+        last = int(n)
+        n.next()
@@ -92,5 +92,22 @@ def test_sg_3():
     assert sg(54) == 118
 
 
+def test_prefix_solver_3():
+    prefixes = e.make_prefix_table()
+    assert len(prefixes) == e.FACTORIALS[9]
+    assert prefixes[0] == ''
+    assert prefixes[e.FACTORIALS[9] - 1] == '122333444455555666666777777788888888'
+    for f_prefix in range(0, e.FACTORIALS[9], 997):
+        assert prefixes[f_prefix] == e.minimal_prefix(f_prefix)
+        assert f_prefix == 0 or e.f(prefixes[f_prefix]) == f_prefix
+    assert e.verify_prefix_table(prefixes) == []
 
 
+def test_digits_gen_limbs():
+    for n in [0, 9, 10, 9999, 10000, 10 ** 64, 10 ** 64 - 1, 7 ** 500, 123456789 ** 40]:
+        assert list(e.digits_gen(n)) == [int(ch) for ch in reversed(str(n))]
+        assert e.digits_sum(n) == sum(int(ch) for ch in str(n))
+        assert e.digits_count(n) == len(str(n))
+    assert e.digits_sum('245') == 11
+    assert e.digits_sum(10 ** 10000 - 1) == 90000
+    assert e.digits_count(10 ** 10000) == 10001
@@ -0,0 +1,18 @@
+import pytest
+import euler.euler_day_04 as e
+
+
+def test_d4_f_digit_string():
+    for n in [1, 342, 10 ** 20, 7 ** 300]:
+        assert e.f(str(n)) == e.f(str(n).encode()) == e.f(n)
+        assert e.digits_sum(str(n)) == e.digits_sum(str(n).encode()) == e.digits_sum(n)
+    assert e.f('') == 0
+    with pytest.raises(ValueError):
+        e.f('12a')
+
+
+def test_d4_f_value_divmod():
+    for i in [1, 8, 9, 65, 100, 1000]:
+        f_value = int(e.f_value_with_digit_sum(i))
+        assert e.f_value_divmod(i) == divmod(f_value, e.FACTORIALS[9])
+        assert e.reverse_f_value_with_digit_sum(i) == e.reverse_f(f_value)
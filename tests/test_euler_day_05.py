@@ -0,0 +1,68 @@
+import pytest
+
+import euler.euler_day_05 as e
+
+
+def test_d5_sum_sg_mod_batch():
+    queries = [(10, 1000), (300, 10**9 + 7), (1000, 10**9 + 7), (5000, 10**9 + 7), (1000, 10**9 + 7), (663, 97)]
+    assert e.sum_sg_mod_batch(queries) == [e.sum_sg_mod(n, m) for n, m in queries]
+    assert e.sum_sg_mod_batch([(10, 1000), (5000, 10**9 + 7)]) == [46, 903685693]
+
+
+def test_d5_sum_sg_mod_jump():
+    for m in (97, 10**9 + 7, 10**18):
+        for n in (1, 204, 205, 366, 1000, 4321):
+            assert e.sum_sg_mod_jump(n, m) == e.sum_sg_mod(n, m)
+    assert e.sum_sg_mod_jump(10**18, 10**18) == 809523809523804658
+    assert e.sum_sg_mod_jump(5 * 10**7, 10**18) == 984126989282535332
+
+
+def test_d5_advance_sg_state():
+    m = 10**9 + 7
+    state = e.sg_state(300, m) + (e.sum_sg_mod(300, m),)
+    assert e.advance_sg_state(state, 300, 0, m) == state
+    assert e.advance_sg_state(state, 300, 700, m) == e.sg_state(1000, m) + (e.sum_sg_mod(1000, m),)
+
+
+def test_sum_sg_mod_parallel():
+    for n in [10, 204, 205, 1000, 5000]:
+        assert e.sum_sg_mod_parallel(n, 2**30 - 1, workers=2, chunks=3) == e.sum_sg_mod(n, 2**30 - 1)
+    assert e.sum_sg_mod_chunk(300, 1000, 10**9) == (e.sum_sg_mod(1000, 10**9) - e.sum_sg_mod(300, 10**9)) % 10**9
+
+
+def test_sum_sg_mod_vec():
+    pytest.importorskip('numpy')
+    for n, m in [(100, 97), (205, 97), (1000, 10**9 + 7), (5000, 2**31 - 1)]:
+        for block_size in [1, 8, 9, 10, 163, 1 << 20]:
+            assert e.sum_sg_mod_vec(n, m, block_size) == e.sum_sg_mod(n, m)
+    assert e.sum_sg_mod_range_vec(1003, 4995, 10**9 + 7) == e.sum_sg_mod_chunk(1003, 4995, 10**9 + 7)
+    sg_, state = e.sg_mod_block(204, 500, 2**31 - 1)
+    assert sg_.tolist() == list(e.islice(e.sg_mod_gen(204, 2**31 - 1), 500))
+    assert state == e.sg_state(704, 2**31 - 1)
+    with pytest.raises(ValueError):
+        e.sum_sg_mod_vec(1000, 2**31)
+
+
+def test_make_sum_param_table():
+    import euler.euler_day_06 as e6
+    assert e.make_sum_param_table() == (e6.sum_param_table, e6.SUM_A, e6.SUM_B)
+    assert e.find_linear_recurrence([1, 1, 2, 3, 5, 8, 13, 21, 34, 55]) == [1, 1]
+    assert e.find_linear_recurrence([2 * 3**j - 5 for j in range(8)]) == [4, -3]
+    with pytest.raises(ValueError):
+        e.find_linear_recurrence([1, 2, 4, 8, 16, 33])
+
+
+def test_make_sgi_mod_table():
+    assert e.f_value_mod_cycle() == (63, 162)
+    assert e.f_value_mod_cycle(97) == (0, 864)
+    assert e.make_sgi_mod_table() == e.sgi_mod_table
+    values = e.f_value_mod_gen(100, 10**6)
+    assert [next(values) for _ in range(30)] == [int(e.f_value_with_digit_sum(i)) % 10**6 for i in range(100, 130)]
+
+
+def test_digit_string_counts():
+    assert e.digit_counts('1234567890' * 400 + '342') == [400, 400, 401, 401, 401, 400, 400, 400, 400, 400]
+    assert e.digit_counts(b'') == [0] * 10
+    assert e.f_and_digits_sum(b'342') == e.f_and_digits_sum('342') == (32, 9)
+    with pytest.raises(ValueError):
+        e.digit_counts(b'12 3')
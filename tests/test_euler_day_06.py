@@ -0,0 +1,240 @@
+import io
+
+import pytest
+
+import euler.euler_day_06 as e
+
+
+def test_d6_sum_sg_mod_batch():
+    queries = [(10, 1000), (300, 10**9 + 7), (1000, 10**9 + 7), (5000, 10**9 + 7), (1000, 10**9 + 7), (663, 97)]
+    assert e.sum_sg_mod_batch(queries) == [e.sum_sg_mod(n, m) for n, m in queries]
+
+
+def test_d6_read_write_queries():
+    queries = e.read_queries(io.BytesIO(b'3\n10 1000\n300 1000000007\n5000 1000000007\n'))
+    assert queries == [(10, 1000), (300, 10**9 + 7), (5000, 10**9 + 7)]
+    out = io.StringIO()
+    e.write_answers(e.sum_sg_mod_batch(queries), out)
+    assert out.getvalue() == '46\n23708065\n903685693\n'
+    for data in [b'', b'\n', b'0\n']:
+        assert e.read_queries(io.BytesIO(data)) == []
+    out = io.StringIO()
+    e.write_answers([], out)
+    assert out.getvalue() == ''
+
+
+def test_d6_sum_sg_suffix_len():
+    a, b = e.SUM_A, e.SUM_B
+    for s in e.sum_param_table[:5]:
+        for n in range(0, 12):
+            exact = b * (a ** n - a * n + n - 1) // (a - 1) ** 2 + s * (a ** n - 1) // (a - 1)
+            for m in (2, 9, 10**9 + 7, 10**18, (a - 1) * 7):
+                assert e.sum_sg_suffix_len(s, a, b, n, m) == exact % m
+
+
+def test_d6_sum_sg_mod_huge():
+    assert e.sum_sg_mod(10**18, 10**18) == 809523809523804658
+    assert e.sum_sg_mod(10**50, 10**15) == 380952380947918
+
+
+def test_d6_f_value_divmod():
+    for i in range(1, 400):
+        f_value = int(e.f_value_with_digit_sum(i))
+        assert e.f_value_divmod(i) == divmod(f_value, e.F9)
+        for m in (1, 7, 10**9 + 7, 2**64):
+            assert e.f_value_divmod(i, m) == (f_value // e.F9 % m, f_value % e.F9)
+
+
+def test_d6_sg_direct():
+    assert sum(e.sg_prefix_cycle) == e.PREFIXES_SUM
+    m = 10**9 + 7
+    for i in range(1, 1200):
+        n = e.g(i) if i > len(e.sg_table) else None
+        expected = e.sg_table[i - 1] if n is None else e.digits_sum(n.prefix) + 9 * n.suffix_len
+        assert e.sg(i) == expected
+        assert e.sg(i, m) == expected % m
+    assert e.sum_sg_mod(1200, m) == sum(e.sg(i, m) for i in range(1, 1201)) % m
+    assert 0 <= e.sg(10**18, m) < m
+
+
+def test_d6_n_number():
+    n = e.N_Number('1233', 5)
+    assert str(n) == '123399999'
+    assert int(n) == 123399999
+    assert len(n) == 9
+    assert n.digits_sum() == e.digits_sum(n) == 9 + 45
+    assert n.f() == e.f(n) == e.f(123399999)
+    assert n.sf() == e.sf(123399999)
+    assert n.mod(97) == 123399999 % 97
+    assert e.N_Number('1299', 1) == e.N_Number('12', 3)
+    assert e.N_Number('12', 3) < e.N_Number('13', 3) < e.N_Number('1', 5) < e.N_Number('11', 5)
+    assert e.N_Number('134', 2) > e.N_Number('1339', 0)
+    prefix, suffix_len = e.g(80)
+    assert int(e.g(80)) == int(prefix + '9' * suffix_len)
+    assert e.g(80).mod(10**9 + 7) == int(e.g(80)) % (10**9 + 7)
+    huge = e.N_Number('1223', 10**17)
+    assert len(huge) == 10**17 + 4
+    assert huge.digits_sum() == 8 + 9 * 10**17
+    assert huge.mod(10**9 + 7) == (1223 * pow(10, 10**17, 10**9 + 7) + pow(10, 10**17, 10**9 + 7) - 1) % (10**9 + 7)
+
+
+def test_d6_write_g(tmp_path):
+    expected = str(e.g(80)).encode()
+    for chunk_size in (1, 7, 1 << 20):
+        out = io.BytesIO()
+        assert e.write_g(80, out, chunk_size=chunk_size) == len(expected)
+        assert out.getvalue() == expected
+    for start, stop in ((0, 3), (2, 40), (30, 31), (100, 2000), (5, None), (len(expected) - 1, 10**9)):
+        out = io.BytesIO()
+        e.write_g(80, out, start, stop, chunk_size=64)
+        assert out.getvalue() == expected[start:stop]
+    path = tmp_path / 'g80.txt'
+    e.write_g(80, str(path))
+    assert path.read_bytes() == expected
+    out = io.BytesIO()
+    e.write_g(10**6, out, 10**20, 10**20 + 10)
+    assert out.getvalue() == b'9' * 10
+    for i in (e.G_FORMULA_MIN, e.G_FORMULA_MIN + 1, 100):
+        out = io.BytesIO()
+        e.write_g(i, out)
+        assert e.digits_sum(out.getvalue()) == e.sg(i)
+    for i in (1, 5, e.G_FORMULA_MIN - 1):
+        with pytest.raises(ValueError):
+            e.write_g(i, io.BytesIO())
+
+
+def test_d6_prefix_columns():
+    assert len(e.PREFIX_COUNTS) == len(e.PREFIX_DIGITS_SUM) == len(e.PREFIX_LEN) == e.F9
+    for f_prefix in list(range(0, e.F9, 101)) + [e.F9 - 1]:
+        prefix = e.minimal_prefix(f_prefix)
+        assert e.prefix_str(f_prefix) == prefix
+        assert e.PREFIX_DIGITS_SUM[f_prefix] == e.digits_sum(prefix)
+        assert e.PREFIX_LEN[f_prefix] == len(prefix)
+        assert sum(d * c for d, c in enumerate(e.prefix_counts(f_prefix))) == e.digits_sum(prefix)
+
+
+def test_d6_tables_file(tmp_path):
+    path = str(tmp_path / 'tables')
+    e.make_tables_file(path)
+    counts, digits_sums, lengths = e.load_tables_file(path)
+    expected_counts, expected_digits_sums, expected_lengths = e.make_prefix_columns()
+    assert list(counts) == list(expected_counts)
+    assert bytes(digits_sums) == expected_digits_sums.tobytes()
+    assert bytes(lengths) == expected_lengths.tobytes()
+    for broken in (b'EU254T01', open(path, 'rb').read()[:-1]):
+        (tmp_path / 'broken').write_bytes(broken)
+        with pytest.raises(ValueError):
+            e.load_tables_file(str(tmp_path / 'broken'))
+
+
+def test_d6_pruned_prefix_columns():
+    counts, digits_sums, lengths = e.make_pruned_prefix_columns()
+    assert len(counts) < 1000
+    full_counts, full_digits_sums, full_lengths = e.make_prefix_columns()
+    for i in range(2 * e.FRAME, 3 * e.FRAME):
+        f_prefix = e.f_value_divmod(i)[1]
+        assert f_prefix in digits_sums
+        assert digits_sums[f_prefix] == full_digits_sums[f_prefix]
+    size = len(counts)
+    for f_prefix in (1, 2, 1000, e.F9 - 1):
+        assert counts[f_prefix] == full_counts[f_prefix]
+        assert lengths[f_prefix] == full_lengths[f_prefix]
+    assert len(counts) > size
+
+
+def test_sum_sg_mod_old_parallel():
+    for n in [10, 490, 491, 3000]:
+        assert e.sum_sg_mod_old_parallel(n, 10**9 + 7, workers=2, chunks=3) == e.sum_sg_mod(n, 10**9 + 7)
+
+
+def test_sum_sg_suffix_len_split():
+    s, a, b = e.sum_param_table[5], e.SUM_A, e.SUM_B
+    for m in [1, 2, 97, 2**30 - 1, 10**9 + 7, 10**18, 2**63 - 25, 3**40, 2**64 + 13, 2**127 - 1]:
+        for n in [0, 1, 2, 17, 10**18, 10**50]:
+            assert e.sum_sg_suffix_len(s, a, b, n, m) == e.sum_sg_suffix_len_big(s, a, b, n, m)
+    assert e.divisor_split.cache_info().maxsize == 1024
+
+
+def test_sg_sums():
+    assert e.sg_sums[0] == 0
+    assert len(e.sg_sums) > e.BREAK_EVEN
+    for n in [1, 2, 100, 323, e.BREAK_EVEN - 1]:
+        assert e.sg_sums[n] == sum(e.sg_table[:n])
+        assert e.sum_sg_mod(n, 10**9 + 7) == sum(e.sg_table[:n]) % (10**9 + 7)
+    assert e.sum_sg_mod_old(700, 10**9 + 7) == sum(e.sg(i) for i in range(1, 701)) % (10**9 + 7)
+    assert e.sum_sg_mod(10**18, 10**18) == 809523809523804658
+
+
+def test_sum_sg_between():
+    for m in [97, 5040, 2**30 - 1, 10**9 + 7]:
+        for a, b in [(1, 1), (5, 4), (1, 499), (100, 700), (499, 501), (501, 662), (650, 2000), (1000, 1161)]:
+            assert e.sum_sg_between(a, b, m) == sum(e.sg(i) for i in range(a, b + 1)) % m
+    for m in [10**9 + 7, 10**18, 2**64 + 13]:
+        for a in [501, 10**6 + 5, 10**17 + 3, 10**18 - 5]:
+            assert (e.sum_sg_mod(a - 1, m) + e.sum_sg_between(a, 10**18, m)) % m == e.sum_sg_mod(10**18, m)
+    assert e.sum_sg_mod_partial(10**6, 10**6 + 100, 10**9 + 7) == e.sum_sg_between(10**6, 10**6 + 99, 10**9 + 7)
+
+
+def test_sum_sg_mod_many():
+    moduli = [10**9 + 7, 998244353, 2**30 - 1, 10**18, 10**6, 97, 1, 97]
+    for n in [5, 499, 500, 10**6, 10**18, 10**50]:
+        assert e.sum_sg_mod_many(n, moduli) == [e.sum_sg_mod(n, m) for m in moduli]
+    assert e.sum_sg_mod_many(10**18, []) == []
+
+
+def test_sum_sg_mod_many_coprime():
+    primes = [p for p in range(2**30 + 1, 2**30 + 100000, 2) if pow(2, p - 1, p) == 1][:3000]
+    assert all(lcm.bit_length() <= e.LCM_GROUP_BITS or len(group) == 1 for group, lcm in e.lcm_groups(primes))
+    assert e.sum_sg_mod_many(10**18, primes) == [e.sum_sg_mod(10**18, p) for p in primes]
+
+
+def test_sg_engine(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    engines = [e.SgEngine(tables_mode='pruned'), e.SgEngine(str(tmp_path / 'prefix.bin'))]
+    queries = [(10, 1000), (700, 10**9 + 7), (10**6, 2**30 - 1), (10**18, 10**18), (10**50, 10**15)] * 4
+    expected = [e.sum_sg_mod(n, m) for n, m in queries]
+    for engine in engines:
+        with ThreadPoolExecutor(8) as pool:
+            assert list(pool.map(lambda q: engine.sum_sg_mod(*q), queries)) == expected
+        assert engine.sum_sg_mod_batch(queries) == expected
+        assert engine.prefix_columns() is engine.prefix_columns()
+    assert (tmp_path / 'prefix.bin').exists()
+    path = tmp_path / 'prefix.bin'
+    data = bytearray(path.read_bytes())
+    data[-1000] ^= 1
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        e.load_tables_file(str(path))
+    assert len(e.SgEngine(str(path)).prefix_columns()[0]) == e.F9
+    e.load_tables_file(str(path))
+    assert engines[0].sum_sg_between(100, 700, 97) == e.sum_sg_between(100, 700, 97)
+
+
+def test_shared_tables():
+    shm = e.publish_tables(e.SgEngine(tables_mode='pruned'))
+    try:
+        engine = e.SgEngine(shared_name=shm.name)
+        counts, digits_sums, lengths = engine.prefix_columns()
+        ref_counts, ref_digits_sums, ref_lengths = e.make_prefix_columns()
+        assert counts.tolist() == ref_counts.tolist()
+        assert bytes(digits_sums) == ref_digits_sums.tobytes() and bytes(lengths) == ref_lengths.tobytes()
+        del counts, digits_sums, lengths
+        for n, m in [(10, 1000), (700, 10**9 + 7), (10**18, 10**18), (10**50, 10**15)]:
+            assert engine.sum_sg_mod(n, m) == e.sum_sg_mod(n, m)
+        assert engine.sum_sg_mod_old(1000, 97) == e.sum_sg_mod(1000, 97)
+        engine.close()
+    finally:
+        shm.close()
+        shm.unlink()
+    with pytest.raises(ValueError):
+        e.tables_from_buffer(b'EU254T01', 'bad')
+
+
+def test_digit_string_counts():
+    # materialized g(i) gives the same f and digits sum as its N_Number form
+    out = io.BytesIO()
+    e.write_g(90, out)
+    n = e.g(90)
+    assert e.f(out.getvalue()) == n.f()
+    assert e.digits_sum(out.getvalue()) == e.digits_sum(str(n)) == n.digits_sum()